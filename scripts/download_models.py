@@ -6,52 +6,97 @@ This script helps download and validate LLM models for text correction.
 It specifically targets LeoLM models optimized for German text.
 """
 
+import asyncio
+import mmap
 import os
 import sys
 import json
 import hashlib
 import argparse
-import subprocess
+import struct
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 from typing import Optional, Dict, Any
 
+import httpx
+
+try:
+    # httpx only speaks HTTP/2 when the optional h2 package is present;
+    # AsyncClient(http2=True) raises ImportError otherwise
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # libuv-based event loop; worthwhile for the many concurrent
+    # range requests the adaptive downloader issues
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 
+@dataclass(frozen=True, slots=True)
+class ModelSpec:
+    """Static metadata for a downloadable model."""
+    name: str
+    url: str
+    size_gb: float
+    filename: str
+    description: str
+    ram_required_gb: int
+    sha256: Optional[str] = None  # fill in once upstream publishes digests
+
+
 # Known model configurations
-KNOWN_MODELS = {
-    "leolm-13b-q4": {
-        "name": "LeoLM 13B Chat (Q4_K_M)",
-        "url": "https://huggingface.co/mradermacher/LeoLM-hesseianai-13b-chat-GGUF/resolve/main/LeoLM-hesseianai-13b-chat.Q4_K_M.gguf",
-        "size_gb": 7.5,
-        "filename": "LeoLM-hesseianai-13b-chat.Q4_K_M.gguf",
-        "description": "Optimized German LLM, 4-bit quantization, best balance",
-        "ram_required_gb": 8
-    },
-    "leolm-13b-q3": {
-        "name": "LeoLM 13B Chat (Q3_K_M)",
-        "url": "https://huggingface.co/mradermacher/LeoLM-hesseianai-13b-chat-GGUF/resolve/main/LeoLM-hesseianai-13b-chat.Q3_K_M.gguf",
-        "size_gb": 6.0,
-        "filename": "LeoLM-hesseianai-13b-chat.Q3_K_M.gguf",
-        "description": "Smaller quantization, lower quality but uses less RAM",
-        "ram_required_gb": 6
-    },
-    "leolm-7b-q4": {
-        "name": "LeoLM 7B Chat (Q4_K_M)",
-        "url": "https://huggingface.co/LeoLM/leo-hessianai-7b-chat-gguf/resolve/main/leo-hessianai-7b-chat-q4_k_m.gguf",
-        "size_gb": 4.0,
-        "filename": "leo-hessianai-7b-chat-q4_k_m.gguf",
-        "description": "Smaller 7B model, faster but less capable",
-        "ram_required_gb": 5
-    }
+KNOWN_MODELS: Dict[str, ModelSpec] = {
+    "leolm-13b-q4": ModelSpec(
+        name="LeoLM 13B Chat (Q4_K_M)",
+        url="https://huggingface.co/mradermacher/LeoLM-hesseianai-13b-chat-GGUF/resolve/main/LeoLM-hesseianai-13b-chat.Q4_K_M.gguf",
+        size_gb=7.5,
+        filename="LeoLM-hesseianai-13b-chat.Q4_K_M.gguf",
+        description="Optimized German LLM, 4-bit quantization, best balance",
+        ram_required_gb=8
+    ),
+    "leolm-13b-q3": ModelSpec(
+        name="LeoLM 13B Chat (Q3_K_M)",
+        url="https://huggingface.co/mradermacher/LeoLM-hesseianai-13b-chat-GGUF/resolve/main/LeoLM-hesseianai-13b-chat.Q3_K_M.gguf",
+        size_gb=6.0,
+        filename="LeoLM-hesseianai-13b-chat.Q3_K_M.gguf",
+        description="Smaller quantization, lower quality but uses less RAM",
+        ram_required_gb=6
+    ),
+    "leolm-7b-q4": ModelSpec(
+        name="LeoLM 7B Chat (Q4_K_M)",
+        url="https://huggingface.co/LeoLM/leo-hessianai-7b-chat-gguf/resolve/main/leo-hessianai-7b-chat-q4_k_m.gguf",
+        size_gb=4.0,
+        filename="leo-hessianai-7b-chat-q4_k_m.gguf",
+        description="Smaller 7B model, faster but less capable",
+        ram_required_gb=5
+    )
+}
+
+# Reverse index so a file on disk can be matched back to its spec
+MODELS_BY_FILENAME: Dict[str, ModelSpec] = {
+    spec.filename: spec for spec in KNOWN_MODELS.values()
 }
 
 
+@lru_cache(maxsize=1)
 def get_default_model_dir() -> Path:
-    """Get the default model directory."""
+    """Get the default model directory (cached for the process)."""
     # Check for LM Studio directory first
     lmstudio_dir = Path.home() / ".lmstudio" / "models"
     if lmstudio_dir.exists():
@@ -69,71 +114,428 @@ def check_disk_space(path: Path, required_gb: float) -> bool:
     return available_gb >= required_gb
 
 
-def download_with_wget(url: str, output_path: Path) -> bool:
-    """Download file using wget with progress bar."""
+def _range_state_path(output_path: Path) -> Path:
+    """Sidecar file recording which byte ranges have been fully written."""
+    return output_path.with_suffix(output_path.suffix + ".ranges")
+
+
+def _load_completed_ranges(output_path: Path) -> set:
+    """Load the set of completed (lo, hi) ranges from a previous run."""
+    state_path = _range_state_path(output_path)
+    if not state_path.exists():
+        return set()
+    try:
+        with open(state_path, "r") as f:
+            return {tuple(r) for r in json.load(f)}
+    except (json.JSONDecodeError, OSError):
+        return set()
+
+
+def _save_completed_ranges(output_path: Path, completed: set):
+    """Persist completed ranges so an interrupted download can resume."""
+    with open(_range_state_path(output_path), "w") as f:
+        json.dump(sorted(completed), f)
+
+
+def _preallocate(fd: int, size: int):
+    """Reserve the full file size up front to avoid fragmentation.
+
+    A single allocation call replaces thousands of incremental extent
+    updates while the parallel ranges are written; on macOS this uses
+    F_PREALLOCATE so APFS can hand out contiguous space.
+    """
+    if sys.platform == "darwin":
+        import fcntl
+        # fstore_t: flags, posmode, offset, length, bytesalloc
+        flags = fcntl.F_ALLOCATECONTIG | fcntl.F_ALLOCATEALL
+        fstore = struct.pack("iillll", flags, fcntl.F_PEOFPOSMODE, 0, size, 0, 0)
+        try:
+            fcntl.fcntl(fd, fcntl.F_PREALLOCATE, fstore)
+        except OSError:
+            # Contiguous allocation can fail on a fragmented disk;
+            # retry without the contiguity requirement
+            fstore = fcntl.F_ALLOCATEALL
+            try:
+                fcntl.fcntl(fd, fcntl.F_PREALLOCATE,
+                            struct.pack("iillll", fstore, fcntl.F_PEOFPOSMODE,
+                                        0, size, 0, 0))
+            except OSError:
+                pass
+        os.ftruncate(fd, size)
+        return
+
     try:
-        cmd = ["wget", "-c", "-O", str(output_path), url]
-        result = subprocess.run(cmd, check=True)
-        return result.returncode == 0
-    except subprocess.CalledProcessError as e:
-        print(f"Error downloading with wget: {e}")
+        os.posix_fallocate(fd, 0, size)
+    except (AttributeError, OSError):
+        os.ftruncate(fd, size)
+
+
+# Size of each range request; small parts let the limiter react quickly
+RANGE_PART_SIZE = 32 * 1024 * 1024
+
+
+class _AdaptiveLimiter:
+    """Semaphore whose capacity is tuned at runtime (AIMD).
+
+    The throughput monitor grows the in-flight range count while the
+    aggregate rate keeps improving and shrinks it when the link is
+    oversubscribed, so the downloader tracks the instantaneous
+    bandwidth instead of relying on a fixed connection count.
+    """
+
+    def __init__(self, initial: int, floor: int = 1, cap: int = 16):
+        self._sem = asyncio.Semaphore(initial)
+        self._value = initial
+        self._debt = 0  # pending capacity reductions
+        self.floor = floor
+        self.cap = cap
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    async def acquire(self):
+        await self._sem.acquire()
+
+    def release(self):
+        # Swallow a release for each pending reduction
+        if self._debt > 0:
+            self._debt -= 1
+        else:
+            self._sem.release()
+
+    def increase(self):
+        if self._value < self.cap:
+            self._value += 1
+            if self._debt > 0:
+                self._debt -= 1
+            else:
+                self._sem.release()
+
+    def decrease(self):
+        if self._value > self.floor:
+            self._value -= 1
+            self._debt += 1
+
+
+async def _throughput_monitor(limiter: _AdaptiveLimiter, progress: dict,
+                              interval: float = 2.0):
+    """Adjust limiter capacity based on a sliding throughput sample."""
+    last_bytes = 0
+    last_rate = 0.0
+    while True:
+        await asyncio.sleep(interval)
+        done = progress["bytes_done"]
+        rate = (done - last_bytes) / interval
+        last_bytes = done
+        if last_rate > 0:
+            if rate >= last_rate * 1.05:
+                limiter.increase()
+            elif rate <= last_rate * 0.95:
+                limiter.decrease()
+        else:
+            limiter.increase()
+        last_rate = rate
+
+
+async def _fetch_range(client: "httpx.AsyncClient", url: str, fd: int,
+                       lo: int, hi: int, limiter: _AdaptiveLimiter,
+                       progress: dict) -> bool:
+    """Stream one byte range into the file at its final offset."""
+    await limiter.acquire()
+    try:
+        headers = {"Range": f"bytes={lo}-{hi}"}
+        offset = lo
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code != 206:
+                return False
+            async for chunk in response.aiter_bytes():
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+                progress["bytes_done"] += len(chunk)
+        return offset == hi + 1
+    finally:
+        limiter.release()
+
+
+async def _download_ranges_async(url: str, output_path: Path, conns: int) -> bool:
+    """Fetch `url` as many small ranges with adaptive concurrency."""
+    async with httpx.AsyncClient(follow_redirects=True, timeout=60.0) as client:
+        head = await client.head(url)
+        total_size = int(head.headers.get("Content-Length", 0))
+        if total_size <= 0 or head.headers.get("Accept-Ranges") != "bytes":
+            # Server does not support ranges; signal caller to fall back
+            return False
+
+        completed = _load_completed_ranges(output_path)
+
+        ranges = []
+        for lo in range(0, total_size, RANGE_PART_SIZE):
+            hi = min(lo + RANGE_PART_SIZE, total_size) - 1
+            if (lo, hi) not in completed:
+                ranges.append((lo, hi))
+
+        limiter = _AdaptiveLimiter(initial=conns)
+        progress = {"bytes_done": 0}
+        monitor = asyncio.ensure_future(_throughput_monitor(limiter, progress))
+
+        fd = os.open(str(output_path), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _preallocate(fd, total_size)
+            results = await asyncio.gather(
+                *[_fetch_range(client, url, fd, lo, hi, limiter, progress)
+                  for lo, hi in ranges],
+                return_exceptions=True
+            )
+        finally:
+            os.close(fd)
+            monitor.cancel()
+
+        for (lo, hi), ok in zip(ranges, results):
+            if ok is True:
+                completed.add((lo, hi))
+        _save_completed_ranges(output_path, completed)
+
+        if all(r is True for r in results):
+            _range_state_path(output_path).unlink(missing_ok=True)
+            return True
         return False
-    except FileNotFoundError:
-        print("wget not found. Install with: brew install wget")
+
+
+def download_with_ranges(url: str, output_path: Path, conns: int = 8) -> bool:
+    """Download a file using parallel HTTP range requests.
+
+    Multiple concurrent streams saturate the bandwidth-delay product on
+    high-latency links where a single TCP connection is the bottleneck.
+    Returns False if the server does not support range requests, so the
+    caller can fall back to curl.
+    """
+    try:
+        return asyncio.run(_download_ranges_async(url, output_path, conns))
+    except (httpx.HTTPError, OSError) as e:
+        print(f"Error downloading with range requests: {e}")
         return False
 
 
-def download_with_curl(url: str, output_path: Path) -> bool:
-    """Download file using curl with progress bar."""
+def download_http(url: str, output_path: Path, resume: bool = True,
+                  hasher=None) -> bool:
+    """Download a file in-process over a single streamed connection.
+
+    Used as fallback when the server does not support range requests.
+    Resumes a partial file by requesting the remaining bytes, the same
+    behaviour as wget -c, without forking an external process.
+
+    When `hasher` (a hashlib object) is given, it is updated with every
+    chunk as it arrives, so the checksum overlaps with network I/O and
+    no second read pass over the finished file is needed.
+    """
+    from tqdm import tqdm
+
+    start = 0
+    mode = "wb"
+    if resume and output_path.exists():
+        start = output_path.stat().st_size
+        mode = "ab"
+
+    headers = {"Range": f"bytes={start}-"} if start else {}
+
     try:
-        cmd = ["curl", "-L", "-C", "-", "-o", str(output_path), url]
-        result = subprocess.run(cmd, check=True)
-        return result.returncode == 0
-    except subprocess.CalledProcessError as e:
-        print(f"Error downloading with curl: {e}")
+        with httpx.Client(follow_redirects=True, timeout=60.0) as client:
+            with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 200 and start:
+                    # Server ignored the range header; restart from zero
+                    start = 0
+                    mode = "wb"
+                elif response.status_code not in (200, 206):
+                    print(f"Error downloading: HTTP {response.status_code}")
+                    return False
+
+                if hasher is not None and start:
+                    # Feed the already-downloaded prefix so the running
+                    # digest stays valid across a resume
+                    with open(output_path, 'rb',
+                              buffering=8 * 1024 * 1024) as f:
+                        for block in iter(lambda: f.read(8 * 1024 * 1024), b''):
+                            hasher.update(block)
+
+                total = int(response.headers.get("Content-Length", 0)) + start
+                with open(output_path, mode) as f, tqdm(
+                    total=total or None,
+                    initial=start,
+                    unit="B",
+                    unit_scale=True,
+                    desc=output_path.name
+                ) as bar:
+                    for chunk in response.iter_bytes(1024 * 1024):
+                        if hasher is not None:
+                            hasher.update(chunk)
+                        f.write(chunk)
+                        bar.update(len(chunk))
+        return True
+    except httpx.HTTPError as e:
+        print(f"Error downloading: {e}")
         return False
 
 
+def verify_sha256(file_path: Path, expected: str) -> bool:
+    """Verify a file's SHA256 digest against a known value.
+
+    hashlib.file_digest releases the GIL and uses the hardware SHA-2
+    path of OpenSSL; a large read buffer keeps syscall count low for
+    multi-gigabyte models.
+    """
+    with open(file_path, 'rb', buffering=8 * 1024 * 1024) as f:
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+    return digest == expected.lower()
+
+
+def validate_gguf_remote(url: str) -> Dict[str, Any]:
+    """Validate a remote GGUF file by fetching only its header.
+
+    A range request for the first bytes is enough to check magic,
+    version and the tensor/metadata counts, so a bad URL is caught
+    before transferring several gigabytes.
+    """
+    result = {
+        "valid": False,
+        "error": None,
+        "version": None,
+        "tensor_count": None,
+        "metadata_count": None
+    }
+
+    # Stream the response and stop after 1 MiB: a server that ignores
+    # the Range header answers 200 with the full multi-gigabyte body,
+    # which must never be buffered in memory just to read the header.
+    header_limit = 1048576
+    try:
+        with httpx.Client(follow_redirects=True, timeout=30.0) as client:
+            with client.stream(
+                "GET", url, headers={"Range": f"bytes=0-{header_limit - 1}"}
+            ) as response:
+                if response.status_code not in (200, 206):
+                    result["error"] = f"HTTP {response.status_code}"
+                    return result
+                parts = []
+                received = 0
+                for chunk in response.iter_bytes():
+                    parts.append(chunk)
+                    received += len(chunk)
+                    if received >= header_limit:
+                        break
+        data = b"".join(parts)[:header_limit]
+    except httpx.HTTPError as e:
+        result["error"] = f"Could not fetch header: {e}"
+        return result
+
+    if len(data) < 24:
+        result["error"] = "Response too short for GGUF header"
+        return result
+
+    if data[0:4] != b'GGUF':
+        result["error"] = f"Invalid header: {data[0:4].hex()}"
+        return result
+
+    version = struct.unpack("<I", data[4:8])[0]
+    if version not in (2, 3):
+        result["error"] = f"Unsupported GGUF version: {version}"
+        return result
+
+    result["valid"] = True
+    result["version"] = version
+    result["tensor_count"] = struct.unpack("<Q", data[8:16])[0]
+    result["metadata_count"] = struct.unpack("<Q", data[16:24])[0]
+    return result
+
+
 def validate_gguf_file(file_path: Path) -> Dict[str, Any]:
-    """Validate that a file is a valid GGUF model."""
+    """Validate that a file is a valid GGUF model.
+
+    The header is read through mmap so the pages stay in the OS cache
+    and are already resident when llama.cpp later maps the same file.
+    """
     result = {
         "valid": False,
         "error": None,
         "size_gb": 0
     }
 
-    if not file_path.exists():
+    try:
+        size = os.stat(file_path).st_size
+    except FileNotFoundError:
         result["error"] = "File does not exist"
         return result
 
-    # Check file size
-    result["size_gb"] = file_path.stat().st_size / (1024**3)
+    result["size_gb"] = size / (1024**3)
 
-    # Check GGUF header
+    if size < 8:
+        result["error"] = "File too small for GGUF header"
+        return result
+
+    # Check GGUF header via a zero-copy mmap view
     try:
         with open(file_path, 'rb') as f:
-            header = f.read(4)
-            if header == b'GGUF':
+            mm = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
+            try:
+                magic = mm[:4]
+                if magic != b'GGUF':
+                    result["error"] = f"Invalid header: {magic.hex()}"
+                    return result
+
+                version = struct.unpack_from("<I", mm, 4)[0]
+                if version not in (2, 3):
+                    result["error"] = f"Unsupported GGUF version: {version}"
+                    return result
+
                 result["valid"] = True
-            else:
-                result["error"] = f"Invalid header: {header.hex()}"
+            finally:
+                mm.close()
     except Exception as e:
         result["error"] = f"Could not read file: {e}"
 
     return result
 
 
-def list_models():
+async def _probe_remote_sizes() -> Dict[str, Optional[int]]:
+    """HEAD all model URLs concurrently (multiplexed over HTTP/2 when h2 is installed)."""
+    async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, follow_redirects=True,
+                                 timeout=30.0) as client:
+        responses = await asyncio.gather(
+            *[client.head(model.url) for model in KNOWN_MODELS.values()],
+            return_exceptions=True
+        )
+    sizes = {}
+    for key, response in zip(KNOWN_MODELS, responses):
+        if isinstance(response, Exception) or response.status_code >= 400:
+            sizes[key] = None
+        else:
+            sizes[key] = int(response.headers.get("Content-Length", 0))
+    return sizes
+
+
+def list_models(verify: bool = False):
     """List all available models for download."""
+    remote_sizes = asyncio.run(_probe_remote_sizes()) if verify else {}
+
     print("\n🤖 Available Models for Download:\n")
     print("-" * 60)
 
     for key, model in KNOWN_MODELS.items():
         print(f"\n📦 {key}:")
-        print(f"   Name: {model['name']}")
-        print(f"   Size: {model['size_gb']:.1f} GB")
-        print(f"   RAM Required: {model['ram_required_gb']} GB")
-        print(f"   Description: {model['description']}")
+        print(f"   Name: {model.name}")
+        print(f"   Size: {model.size_gb:.1f} GB")
+        print(f"   RAM Required: {model.ram_required_gb} GB")
+        print(f"   Description: {model.description}")
+
+        if verify:
+            remote = remote_sizes.get(key)
+            if not remote:
+                print("   Remote: ❌ URL did not resolve")
+            else:
+                remote_gb = remote / (1024**3)
+                mismatch = abs(remote_gb - model.size_gb) > model.size_gb * 0.1
+                note = " ⚠️ differs from recorded size" if mismatch else ""
+                print(f"   Remote: {remote_gb:.1f} GB{note}")
 
     print("\n" + "-" * 60)
 
@@ -155,12 +557,12 @@ def download_model(model_key: str, output_dir: Optional[Path] = None) -> bool:
     model_dir = output_dir / "mradermacher" / "LeoLM-hesseianai-13b-chat-GGUF"
     model_dir.mkdir(parents=True, exist_ok=True)
 
-    output_path = model_dir / model["filename"]
+    output_path = model_dir / model.filename
 
-    print(f"\n📥 Downloading {model['name']}...")
-    print(f"   URL: {model['url']}")
+    print(f"\n📥 Downloading {model.name}...")
+    print(f"   URL: {model.url}")
     print(f"   Destination: {output_path}")
-    print(f"   Size: {model['size_gb']:.1f} GB")
+    print(f"   Size: {model.size_gb:.1f} GB")
 
     # Check if file already exists
     if output_path.exists():
@@ -175,16 +577,40 @@ def download_model(model_key: str, output_dir: Optional[Path] = None) -> bool:
             output_path.unlink()
 
     # Check disk space
-    if not check_disk_space(output_path.parent, model["size_gb"] * 1.2):
-        print(f"❌ Not enough disk space. Need at least {model['size_gb'] * 1.2:.1f} GB")
+    if not check_disk_space(output_path.parent, model.size_gb * 1.2):
+        print(f"❌ Not enough disk space. Need at least {model.size_gb * 1.2:.1f} GB")
+        return False
+
+    # Pre-flight check: validate the remote header before the full transfer
+    print("\n🔍 Checking remote GGUF header...")
+    remote = validate_gguf_remote(model.url)
+    if not remote["valid"]:
+        print(f"❌ Remote file is not a valid GGUF model: {remote['error']}")
         return False
+    print(f"✅ Remote header OK (GGUF v{remote['version']}, "
+          f"{remote['tensor_count']} tensors)")
+
+    # Download to a .part file so partial transfers never shadow a
+    # finished model and interrupted runs resume cleanly
+    part_path = output_path.with_suffix(output_path.suffix + ".part")
 
-    # Try downloading with wget first, then curl
+    # Try parallel range download first; fall back to a single stream
+    # if the server does not support range requests
     print("\n⏳ Starting download (this may take a while)...")
-    success = download_with_wget(model["url"], output_path)
+    stream_digest = None
+    success = download_with_ranges(model.url, part_path)
     if not success:
-        print("Trying with curl...")
-        success = download_with_curl(model["url"], output_path)
+        print("Falling back to single-stream download...")
+        # The range path preallocates the .part file to its full size, so
+        # a resume would start past the end (HTTP 416) and any holes would
+        # poison the streamed hash — start the fallback from scratch
+        part_path.unlink(missing_ok=True)
+        _range_state_path(part_path).unlink(missing_ok=True)
+        # Hash while downloading so no second read pass is needed
+        hasher = hashlib.sha256() if model.sha256 else None
+        success = download_http(model.url, part_path, resume=False, hasher=hasher)
+        if success and hasher is not None:
+            stream_digest = hasher.hexdigest()
 
     if not success:
         print("❌ Download failed")
@@ -192,28 +618,88 @@ def download_model(model_key: str, output_dir: Optional[Path] = None) -> bool:
 
     # Validate downloaded file
     print("\n🔍 Validating downloaded file...")
-    validation = validate_gguf_file(output_path)
-
-    if validation["valid"]:
-        print(f"✅ Model downloaded successfully ({validation['size_gb']:.1f} GB)")
+    validation = validate_gguf_file(part_path)
 
-        # Update config
-        update_config(output_path)
-        return True
-    else:
+    if not validation["valid"]:
         print(f"❌ Downloaded file is invalid: {validation['error']}")
         return False
 
+    # Verify integrity when a digest is known; the single-stream path
+    # already hashed the bytes as they arrived
+    if model.sha256:
+        print("\n🔐 Verifying SHA256 checksum...")
+        if stream_digest is not None:
+            checksum_ok = stream_digest == model.sha256.lower()
+        else:
+            checksum_ok = verify_sha256(part_path, model.sha256)
+        if not checksum_ok:
+            print("❌ Checksum mismatch — removing corrupted file")
+            part_path.unlink()
+            return False
+        print("✅ Checksum OK")
+
+    # Move into place: rename on the same filesystem, otherwise
+    # shutil.copyfile (zero-copy fcopyfile/clonefile on APFS)
+    try:
+        os.rename(part_path, output_path)
+    except OSError:
+        import shutil
+        shutil.copyfile(part_path, output_path)
+        os.unlink(part_path)
+
+    print(f"✅ Model downloaded successfully ({validation['size_gb']:.1f} GB)")
+
+    # Update config
+    update_config(output_path)
+    return True
+
+
+async def _download_many(model_keys, output_dir: Optional[Path]) -> list:
+    """Download several models concurrently, capped at 4 transfers."""
+    semaphore = asyncio.Semaphore(4)
+
+    async def download_one(model_key: str) -> bool:
+        async with semaphore:
+            # download_model is blocking (prints, validation, file I/O);
+            # run each transfer in its own thread
+            return await asyncio.to_thread(download_model, model_key, output_dir)
+
+    return await asyncio.gather(
+        *[download_one(key) for key in model_keys],
+        return_exceptions=True
+    )
+
+
+def download_models_parallel(model_keys, output_dir: Optional[Path] = None) -> bool:
+    """Download multiple models in parallel; returns True if all succeeded."""
+    if len(model_keys) == 1:
+        return download_model(model_keys[0], output_dir)
+
+    results = asyncio.run(_download_many(model_keys, output_dir))
+    success = True
+    for key, result in zip(model_keys, results):
+        if isinstance(result, Exception):
+            print(f"❌ {key} failed: {result}")
+            success = False
+        elif not result:
+            success = False
+    return success
+
 
 def update_config(model_path: Path):
     """Update the Whisper tool configuration with the new model path."""
     config_path = Path.home() / ".whisper_tool.json"
 
     try:
-        # Load existing config
+        # Load existing config (orjson is ~5-10x faster than stdlib json).
+        # Cap the read at 1 MiB: ample for any real config, and bounds
+        # the allocation if the file has been tampered with.
         if config_path.exists():
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            raw = config_path.read_bytes()[:1_048_576]
+            if orjson is not None:
+                config = orjson.loads(raw) if raw else {}
+            else:
+                config = json.loads(raw) if raw else {}
         else:
             config = {}
 
@@ -225,8 +711,10 @@ def update_config(model_path: Path):
         config["text_correction"]["enabled"] = True
 
         # Save updated config
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        if orjson is not None:
+            config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            config_path.write_text(json.dumps(config, indent=2))
 
         print(f"\n✅ Configuration updated: {config_path}")
         print(f"   Model path: {model_path}")
@@ -247,13 +735,19 @@ def main():
 
     # List command
     list_parser = subparsers.add_parser("list", help="List available models")
+    list_parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Check that model URLs resolve and sizes match"
+    )
 
     # Download command
     download_parser = subparsers.add_parser("download", help="Download a model")
     download_parser.add_argument(
         "model",
+        nargs="+",
         choices=list(KNOWN_MODELS.keys()),
-        help="Model to download"
+        help="Model(s) to download"
     )
     download_parser.add_argument(
         "--output-dir",
@@ -269,21 +763,54 @@ def main():
         help="Path to model file"
     )
 
+    # Inspect command
+    inspect_parser = subparsers.add_parser(
+        "inspect", help="Inspect a remote GGUF file without downloading it"
+    )
+    inspect_parser.add_argument(
+        "url",
+        help="URL of the GGUF file"
+    )
+
     args = parser.parse_args()
 
     if args.command == "list" or args.command is None:
-        list_models()
+        list_models(verify=getattr(args, "verify", False))
         print("\n💡 To download a model, run:")
         print("   python download_models.py download leolm-13b-q4")
 
     elif args.command == "download":
-        success = download_model(args.model, args.output_dir)
+        success = download_models_parallel(args.model, args.output_dir)
         sys.exit(0 if success else 1)
 
     elif args.command == "validate":
         validation = validate_gguf_file(args.path)
         if validation["valid"]:
             print(f"✅ Valid GGUF file ({validation['size_gb']:.1f} GB)")
+            # If the filename matches a known model, check it against the spec
+            spec = MODELS_BY_FILENAME.get(args.path.name)
+            if spec is not None:
+                if abs(validation["size_gb"] - spec.size_gb) > spec.size_gb * 0.1:
+                    print(f"⚠️  Size differs from {spec.name}: "
+                          f"expected ~{spec.size_gb:.1f} GB")
+                    validation["valid"] = False
+                elif spec.sha256:
+                    print("🔐 Verifying SHA256 checksum...")
+                    if verify_sha256(args.path, spec.sha256):
+                        print("✅ Checksum OK")
+                    else:
+                        print("❌ Checksum mismatch")
+                        validation["valid"] = False
+        else:
+            print(f"❌ Invalid: {validation['error']}")
+        sys.exit(0 if validation["valid"] else 1)
+
+    elif args.command == "inspect":
+        validation = validate_gguf_remote(args.url)
+        if validation["valid"]:
+            print(f"✅ Valid GGUF file (version {validation['version']}, "
+                  f"{validation['tensor_count']} tensors, "
+                  f"{validation['metadata_count']} metadata entries)")
         else:
             print(f"❌ Invalid: {validation['error']}")
         sys.exit(0 if validation["valid"] else 1)
@@ -27,6 +27,7 @@ setup(
     install_requires=[
         "numpy",
         "httpx", # For making HTTP requests, especially for model downloads
+        "orjson", # Fast JSON for config and WebSocket payloads
         "tqdm",
         "pyyaml",
         "fastapi",
@@ -38,10 +39,10 @@ setup(
     ],
     extras_require={
         "chatbot": ["chromadb", "faiss-cpu", "sentence-transformers"],
-        "llm": ["llama-cpp-python>=0.2.0", "sentencepiece>=0.1.99", "nltk>=3.8", "transformers>=4.21.0", "packaging>=20.0"],
-        "web": ["fastapi", "uvicorn", "jinja2", "python-multipart", "websockets", "httpx", "sounddevice"],
+        "llm": ["llama-cpp-python>=0.2.0", "sentencepiece>=0.1.99", "nltk>=3.8", "transformers>=4.21.0", "packaging>=20.0", "uvloop"],
+        "web": ["fastapi", "uvicorn", "jinja2", "python-multipart", "websockets", "httpx", "sounddevice", "uvloop"],
         "dev": ["pytest", "black", "isort", "flake8", "mypy"],
-        "full": ["chromadb", "faiss-cpu", "sentence-transformers", "fastapi", "uvicorn", "jinja2", "python-multipart", "srt", "websockets", "httpx", "sounddevice", "llama-cpp-python>=0.2.0", "sentencepiece>=0.1.99", "nltk>=3.8", "transformers>=4.21.0", "packaging>=20.0"]
+        "full": ["chromadb", "faiss-cpu", "sentence-transformers", "fastapi", "uvicorn", "jinja2", "python-multipart", "srt", "websockets", "httpx", "sounddevice", "uvloop", "llama-cpp-python>=0.2.0", "sentencepiece>=0.1.99", "nltk>=3.8", "transformers>=4.21.0", "packaging>=20.0"]
     },
     entry_points={
         "console_scripts": [
@@ -8,14 +8,14 @@ DEFAULT_MODEL_DIR = "~/whisper_models"
 DEFAULT_OUTPUT_DIR = "~/transcriptions"
 DEFAULT_TEMP_DIR = "~/transcriptions/temp"
 
-# Unterstützte Audioformate
-SUPPORTED_AUDIO_FORMATS = [".wav", ".mp3", ".ogg", ".flac", ".opus"]
+# Unterstützte Audioformate (kleingeschrieben; Aufrufer übergeben ext.lower())
+SUPPORTED_AUDIO_FORMATS = frozenset({".wav", ".mp3", ".ogg", ".flac", ".opus"})
 
 # Unterstützte Videoformate (für Audioextraktion)
-SUPPORTED_VIDEO_FORMATS = [".mp4", ".avi", ".mov", ".mkv", ".webm"]
+SUPPORTED_VIDEO_FORMATS = frozenset({".mp4", ".avi", ".mov", ".mkv", ".webm"})
 
 # Unterstützte Ausgabeformate
-SUPPORTED_OUTPUT_FORMATS = ["txt", "srt", "vtt", "json"]
+SUPPORTED_OUTPUT_FORMATS = frozenset({"txt", "srt", "vtt", "json"})
 
 # Konfigurationsdateiname
 CONFIG_FILENAME = ".whisper_tool.json"
@@ -3,8 +3,10 @@ Event system for the Whisper Transcription Tool.
 """
 
 import logging
+import threading
+import time
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 import asyncio
 
 from .logging_setup import get_logger
@@ -58,6 +60,7 @@ class EventBus:
         if cls._instance is None:
             cls._instance = super(EventBus, cls).__new__(cls)
             cls._instance._subscribers = {}
+            cls._instance._loop = None
         return cls._instance
     
     def __init__(self):
@@ -91,20 +94,42 @@ class EventBus:
             self._subscribers[event_type].remove(callback)
             logger.debug(f"Unsubscribed from {event_type.name}")
     
+    def set_loop(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """
+        Register the event loop that async handlers should run on.
+
+        Publishing is allowed from any thread (worker threads, the
+        coalescer flush thread, executor pools); async handlers are then
+        dispatched onto this loop via run_coroutine_threadsafe.
+
+        Args:
+            loop: The running event loop, or None to clear it
+        """
+        self._loop = loop
+
     def publish(self, event: Event) -> None:
         """
         Publish an event to all subscribers.
-        
+
+        Safe to call from any thread: sync handlers run inline on the
+        calling thread, async handlers are scheduled on the running loop
+        of the calling thread or — when publishing from a worker thread —
+        on the loop registered via set_loop().
+
         Args:
             event: Event to publish
         """
         if event.event_type not in self._subscribers or not self._subscribers[event.event_type]:
             logger.debug(f"No subscribers for event type {event.event_type}, not publishing.")
             return
-        
+
         logger.debug(f"Publishing {event}")
-        
-        loop = asyncio.get_event_loop() # Get the current event loop
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
         # Create a copy of the list in case a handler modifies the subscription list during iteration
         handlers = list(self._subscribers[event.event_type])
         for handler in handlers:
@@ -112,7 +137,16 @@ class EventBus:
                 if asyncio.iscoroutinefunction(handler):
                     # If the handler is an async function, schedule it as a task
                     logger.debug(f"Scheduling async handler {handler.__name__} for event {event.event_type}")
-                    loop.create_task(handler(event))
+                    if running_loop is not None:
+                        running_loop.create_task(handler(event))
+                    elif self._loop is not None and self._loop.is_running():
+                        asyncio.run_coroutine_threadsafe(handler(event), self._loop)
+                    else:
+                        # No loop available (e.g. pure CLI mode): async
+                        # handlers cannot run, skip instead of crashing
+                        logger.debug(
+                            f"No event loop available for async handler {handler.__name__}, skipping"
+                        )
                 else:
                     # If it's a regular function, call it directly
                     logger.debug(f"Calling sync handler {handler.__name__} for event {event.event_type}")
@@ -134,9 +168,65 @@ class EventBus:
         return self._subscribers.get(event_type, set())
 
 
+class EventCoalescer:
+    """Coalesces high-frequency events before they hit the bus.
+
+    Hot loops (download chunks, per-line progress parsing) can post
+    thousands of PROGRESS_UPDATE events per second; subscribers only
+    care about the latest state. The coalescer keeps the most recent
+    event per (type, task, user) key and a background thread flushes
+    them through the normal publish path every `interval` seconds, so
+    the hot loop never pays publish latency and bursts collapse to at
+    most one event per key per flush.
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self._interval = interval
+        self._pending: Dict[Tuple, Event] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def post(self, event_type: EventType, data: Optional[Dict[str, Any]] = None) -> None:
+        """Queue an event, replacing any pending event with the same key.
+
+        The payload kind is part of the key: percent updates and
+        terminal-output batches share task and user_id, and a percent
+        frame is only re-published on change — clobbering one with the
+        other would lose it for good.
+        """
+        payload = data or {}
+        key = (event_type, payload.get("task"), payload.get("user_id"),
+               "progress" in payload)
+        with self._lock:
+            self._pending[key] = Event(event_type, data)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def flush(self) -> None:
+        """Publish all pending events immediately."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for event in pending.values():
+            event_bus.publish(event)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self._interval)
+            try:
+                self.flush()
+            except Exception as e:
+                # Der Flush-Thread darf nie an einem fehlerhaften Handler
+                # sterben; Events des nächsten Intervalls kämen sonst nie an
+                logger.error(f"Error flushing coalesced events: {e}", exc_info=True)
+
+
 # Global event bus instance
 event_bus = EventBus()
 
+# Global coalescer for high-frequency progress events
+event_coalescer = EventCoalescer()
+
 
 def subscribe(event_type: EventType, callback: Callable[[Event], None]) -> None:
     """
@@ -160,6 +250,19 @@ def unsubscribe(event_type: EventType, callback: Callable[[Event], None]) -> Non
     event_bus.unsubscribe(event_type, callback)
 
 
+def set_event_loop(loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """
+    Register the event loop for async handlers.
+
+    Call once from the running server loop (e.g. in a startup hook) so
+    that publishes from worker threads reach async subscribers.
+
+    Args:
+        loop: The running event loop, or None to clear it
+    """
+    event_bus.set_loop(loop)
+
+
 def publish(event_type: EventType, data: Optional[Dict[str, Any]] = None) -> None:
     """
     Publish an event.
@@ -170,3 +273,18 @@ def publish(event_type: EventType, data: Optional[Dict[str, Any]] = None) -> Non
     """
     event = Event(event_type, data)
     event_bus.publish(event)
+
+
+def publish_coalesced(event_type: EventType, data: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Publish an event through the coalescer.
+
+    Use for high-frequency progress events where only the latest state
+    matters; terminal events (completed/failed) should keep using
+    publish() so they are never dropped.
+
+    Args:
+        event_type: Type of event to publish
+        data: Event data
+    """
+    event_coalescer.post(event_type, data)
@@ -1,6 +1,7 @@
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import httpx
 import time
 import math
@@ -140,19 +141,34 @@ def get_downloaded_models(model_dir_str: str) -> List[str]:
     Returns:
         A list of model names (like 'base', 'large-v3') found in the directory.
     """
-    downloaded = []
     try:
         model_dir = Path(model_dir_str).expanduser().resolve() # Expand ~ and resolve path
     except Exception as e:
         logger.error(f"Error resolving model directory path '{model_dir_str}': {e}")
         return [] # Return empty list if path is invalid
 
-    if not model_dir.is_dir():
+    try:
+        dir_mtime_ns = model_dir.stat().st_mtime_ns
+    except OSError:
         logger.warning(f"Model directory '{model_dir}' does not exist or is not a directory.")
         return []
 
+    # The cache is keyed on the directory mtime, so adding or removing a
+    # model file invalidates it with a single stat call per request
+    return list(_scan_downloaded_models(str(model_dir), dir_mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _scan_downloaded_models(model_dir_str: str, dir_mtime_ns: int) -> Tuple[str, ...]:
+    """Scan the model directory for 'ggml-*.bin' files (cached per directory mtime)."""
+    model_dir = Path(model_dir_str)
+    if not model_dir.is_dir():
+        logger.warning(f"Model directory '{model_dir}' does not exist or is not a directory.")
+        return ()
+
     logger.info(f"Scanning for models in: {model_dir}")
 
+    downloaded: List[str] = []
     try:
         # Scan for model files (both old and new format)
         for item in model_dir.glob("ggml-*.bin"):
@@ -175,10 +191,10 @@ def get_downloaded_models(model_dir_str: str) -> List[str]:
 
     except OSError as e:
         logger.warning(f"Error scanning model directory {model_dir}: {e}")
-        return []
+        return ()
 
     logger.info(f"Found downloaded models corresponding to: {downloaded}")
-    return downloaded
+    return tuple(downloaded)
 
 
 # --- Download Logic ---
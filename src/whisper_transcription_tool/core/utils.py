@@ -2,6 +2,7 @@
 Utility functions for the Whisper Transcription Tool.
 """
 
+import errno
 import os
 import shutil
 import subprocess
@@ -94,6 +95,35 @@ def ensure_directory_exists(directory: Union[str, Path]) -> bool:
         return False
 
 
+def fast_move(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """
+    Move a file, preferring a rename over a copy.
+
+    On the same filesystem this is a single rename(2). Across volumes
+    (e.g. tmpfs to the user's home) it falls back to shutil.copyfile,
+    which uses the fastest zero-copy primitive the platform offers
+    (fcopyfile on macOS, sendfile on Linux) instead of shutil.move's
+    default 64 KiB copy loop. os.sendfile is deliberately not called
+    directly: on macOS it only accepts socket destinations and would
+    fail with ENOTSOCK for regular files.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+    """
+    src = str(src)
+    dst = str(dst)
+    try:
+        os.rename(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    shutil.copyfile(src, dst)
+    os.unlink(src)
+
+
 def get_file_extension(file_path: Union[str, Path]) -> str:
     """
     Get the extension of a file.
@@ -8,12 +8,16 @@ import sys
 from pathlib import Path
 from typing import Dict, Optional
 
-from .core.config import load_config, save_config
-from .core.logging_setup import setup_logging
-from .core.models import OutputFormat, WhisperModel
-
 logger = logging.getLogger(__name__)
 
+# Choice lists are kept as plain strings so that `--help` and argument
+# parsing do not import the core package (which pulls in psutil/yaml).
+# They mirror WhisperModel and OutputFormat in core/models.py.
+WHISPER_MODEL_CHOICES = [
+    "tiny", "base", "small", "medium", "large", "large-v3", "large-v3-turbo"
+]
+OUTPUT_FORMAT_CHOICES = ["txt", "srt", "vtt", "json"]
+
 
 def parse_args():
     """Parse command line arguments."""
@@ -43,9 +47,9 @@ def parse_args():
         help="Path to audio file"
     )
     transcribe_parser.add_argument(
-        "--model", 
-        choices=[m.value for m in WhisperModel],
-        default=WhisperModel.LARGE_V3_TURBO.value,
+        "--model",
+        choices=WHISPER_MODEL_CHOICES,
+        default="large-v3-turbo",
         help="Whisper model to use"
     )
     transcribe_parser.add_argument(
@@ -53,9 +57,9 @@ def parse_args():
         help="Language code (leave empty for auto-detection)"
     )
     transcribe_parser.add_argument(
-        "--output-format", 
-        choices=[f.value for f in OutputFormat],
-        default=OutputFormat.TXT.value,
+        "--output-format",
+        choices=OUTPUT_FORMAT_CHOICES,
+        default="txt",
         help="Output format"
     )
     transcribe_parser.add_argument(
@@ -155,131 +159,166 @@ def parse_args():
     return parser.parse_args()
 
 
+def _cmd_transcribe(args, config) -> int:
+    """Handle the transcribe command."""
+    from .module1_transcribe import transcribe_audio
+
+    # Update config with CLI overrides for text correction
+    if args.enable_correction:
+        config.setdefault("text_correction", {})["enabled"] = True
+    if hasattr(args, 'correction_level') and args.correction_level:
+        config.setdefault("text_correction", {})["correction_level"] = args.correction_level
+    if args.dialect_normalization:
+        config.setdefault("text_correction", {})["dialect_normalization"] = True
+
+    result = transcribe_audio(
+        audio_path=args.audio_file,
+        output_format=args.output_format,
+        language=args.language,
+        model=args.model,
+        output_path=args.output,
+        srt_max_chars=args.srt_max_chars,
+        srt_max_duration=args.srt_max_duration,
+        config=config
+    )
+
+    if result.success:
+        logger.info(f"Transcription completed: {result.output_file}")
+        if result.text:
+            print(result.text)
+        return 0
+
+    logger.error(f"Transcription failed: {result.error}")
+    return 1
+
+
+def _cmd_extract(args, config) -> int:
+    """Handle the extract command."""
+    from .module2_extract import extract_audio
+
+    result = extract_audio(
+        args.video_file,
+        output_path=args.output,
+        config=config
+    )
+
+    if result.success:
+        logger.info(f"Audio extraction completed: {result.audio_path}")
+        return 0
+
+    logger.error(f"Audio extraction failed: {result.error}")
+    return 1
+
+
+def _cmd_phone(args, config) -> int:
+    """Handle the phone command."""
+    from .module3_phone import process_tracks
+
+    result = process_tracks(
+        args.track_a,
+        args.track_b,
+        output_path=args.output,
+        config=config
+    )
+
+    if result.success:
+        logger.info(f"Phone call processing completed: {result.output_file}")
+        return 0
+
+    logger.error(f"Phone call processing failed: {result.error}")
+    return 1
+
+
+def _cmd_chatbot(args, config) -> int:
+    """Handle the chatbot command."""
+    from .module4_chatbot import start_chatbot
+
+    start_chatbot(
+        transcript_path=args.transcript,
+        mode=args.mode,
+        config=config
+    )
+    return 0
+
+
+def _cmd_web(args, config) -> int:
+    """Handle the web command."""
+    try:
+        from .web import start_web_server
+
+        start_web_server(
+            host=args.host,
+            port=args.port,
+            config_path=args.config
+        )
+        return 0
+    except ImportError:
+        logger.error("Web dependencies not installed. Install with pip install 'whisper_transcription_tool[web]'")
+        return 1
+
+
+def _cmd_status(args, config) -> int:
+    """Handle the status command."""
+    from .core.config import print_correction_status, is_correction_available
+
+    if args.correction:
+        # Show only text correction status
+        print_correction_status(config)
+        return 0
+
+    # Show general system status
+    print(f"Whisper Transcription Tool - System Status")
+    print(f"Config loaded: {'✅' if config else '❌'}")
+    print(f"Project root: {config.get('whisper', {}).get('model_path', 'Unknown')}")
+
+    # Check text correction
+    correction_status = is_correction_available(config)
+    correction_enabled = config.get("text_correction", {}).get("enabled", False)
+
+    print(f"Text correction: {'✅ Enabled' if correction_enabled else '❌ Disabled'}")
+    print(f"Text correction available: {'✅ Yes' if correction_status['available'] else '❌ No'}")
+
+    if not correction_status['available']:
+        print(f"  Reason: {correction_status['reason']}")
+
+    print("\nUse --correction flag to see detailed text correction status")
+    return 0
+
+
+# Command dispatch table; each handler does its own lazy imports
+COMMAND_HANDLERS = {
+    "transcribe": _cmd_transcribe,
+    "extract": _cmd_extract,
+    "phone": _cmd_phone,
+    "chatbot": _cmd_chatbot,
+    "web": _cmd_web,
+    "status": _cmd_status,
+}
+
+
 def main():
     """Main entry point for the application."""
     args = parse_args()
-    
+
+    # Imported here so that `--help` exits before the core package
+    # (psutil, yaml, ...) is loaded
+    from .core.config import load_config
+    from .core.logging_setup import setup_logging
+
     # Load configuration
     config = load_config(args.config)
-    
+
     # Setup logging
     setup_logging(log_level=args.log_level, config=config)
-    
+
     logger.info("Starting Whisper Transcription Tool")
-    
-    # Handle commands
-    if args.command == "transcribe":
-        from .module1_transcribe import transcribe_audio
-        
-        # Update config with CLI overrides for text correction
-        if args.enable_correction:
-            config.setdefault("text_correction", {})["enabled"] = True
-        if hasattr(args, 'correction_level') and args.correction_level:
-            config.setdefault("text_correction", {})["correction_level"] = args.correction_level
-        if args.dialect_normalization:
-            config.setdefault("text_correction", {})["dialect_normalization"] = True
-
-        result = transcribe_audio(
-            audio_path=args.audio_file,
-            output_format=args.output_format,
-            language=args.language,
-            model=args.model,
-            output_path=args.output,
-            srt_max_chars=args.srt_max_chars,
-            srt_max_duration=args.srt_max_duration,
-            config=config
-        )
-        
-        if result.success:
-            logger.info(f"Transcription completed: {result.output_file}")
-            if result.text:
-                print(result.text)
-        else:
-            logger.error(f"Transcription failed: {result.error}")
-            return 1
-    
-    elif args.command == "extract":
-        from .module2_extract import extract_audio
-        
-        result = extract_audio(
-            args.video_file,
-            output_path=args.output,
-            config=config
-        )
-        
-        if result.success:
-            logger.info(f"Audio extraction completed: {result.audio_path}")
-        else:
-            logger.error(f"Audio extraction failed: {result.error}")
-            return 1
-    
-    elif args.command == "phone":
-        from .module3_phone import process_tracks
-        
-        result = process_tracks(
-            args.track_a,
-            args.track_b,
-            output_path=args.output,
-            config=config
-        )
-        
-        if result.success:
-            logger.info(f"Phone call processing completed: {result.output_file}")
-        else:
-            logger.error(f"Phone call processing failed: {result.error}")
-            return 1
-    
-    elif args.command == "chatbot":
-        from .module4_chatbot import start_chatbot
-        
-        start_chatbot(
-            transcript_path=args.transcript,
-            mode=args.mode,
-            config=config
-        )
-    
-    elif args.command == "web":
-        try:
-            from .web import start_web_server
-            
-            start_web_server(
-                host=args.host,
-                port=args.port,
-                config_path=args.config
-            )
-        except ImportError:
-            logger.error("Web dependencies not installed. Install with pip install 'whisper_transcription_tool[web]'")
-            return 1
-
-    elif args.command == "status":
-        from .core.config import print_correction_status, is_correction_available
-
-        if args.correction:
-            # Show only text correction status
-            print_correction_status(config)
-        else:
-            # Show general system status
-            print(f"Whisper Transcription Tool - System Status")
-            print(f"Config loaded: {'✅' if config else '❌'}")
-            print(f"Project root: {config.get('whisper', {}).get('model_path', 'Unknown')}")
-
-            # Check text correction
-            correction_status = is_correction_available(config)
-            correction_enabled = config.get("text_correction", {}).get("enabled", False)
-
-            print(f"Text correction: {'✅ Enabled' if correction_enabled else '❌ Disabled'}")
-            print(f"Text correction available: {'✅ Yes' if correction_status['available'] else '❌ No'}")
-
-            if not correction_status['available']:
-                print(f"  Reason: {correction_status['reason']}")
-
-            print("\nUse --correction flag to see detailed text correction status")
-
-    else:
+
+    handler = COMMAND_HANDLERS.get(args.command)
+    if handler is None:
         logger.error("No command specified")
         return 1
-    
-    return 0
+
+    return handler(args, config)
 
 
 if __name__ == "__main__":
@@ -7,70 +7,84 @@ Handles audio transcription using Whisper.cpp on Apple Silicon.
 import os
 import sys
 
-# Finde den Projektpfad
+# Projektwurzel einmalig aufloesen: __file__ liegt unter
+# src/whisper_transcription_tool/module1_transcribe/, drei Ebenen
+# unter der Repo-Wurzel
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
 def find_project_root():
     """Find the project root directory."""
-    # Beginne mit dem aktuellen Verzeichnis der Datei
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # Navigiere nach oben bis zum Projektverzeichnis
-    # Wir suchen nach dem 'src' Verzeichnis als Indikator
-    while current_dir and not current_dir.endswith('src'):
-        parent_dir = os.path.dirname(current_dir)
-        if parent_dir == current_dir:
-            # Wir haben das Root-Verzeichnis erreicht ohne 'src' zu finden
-            return None
-        current_dir = parent_dir
-    
-    # Gehe ein Level hoeher vom 'src' Verzeichnis
-    return os.path.dirname(current_dir)
+    return _REPO_ROOT
 
 # Projektverzeichnis ermitteln
-project_dir = find_project_root()
-if project_dir:
-    # Setze DYLD_LIBRARY_PATH fuer dynamische Bibliotheken
+project_dir = _REPO_ROOT
+
+# Guard, damit die Umgebungsvariable nur einmal pro Prozess gesetzt wird
+_dyld_initialized = False
+
+
+def _init_dyld_paths():
+    """Setze DYLD_LIBRARY_PATH fuer dynamische Bibliotheken (einmalig)."""
+    global _dyld_initialized
+    if _dyld_initialized or not project_dir:
+        return
+    _dyld_initialized = True
+
     whisper_lib_paths = [
         os.path.join(project_dir, 'deps', 'whisper.cpp', 'build', 'src'),
         os.path.join(project_dir, 'deps', 'whisper.cpp', 'build', 'ggml', 'src'),
         os.path.join(project_dir, 'deps', 'whisper.cpp', 'build', 'ggml', 'src', 'ggml-blas'),
         os.path.join(project_dir, 'deps', 'whisper.cpp', 'build', 'ggml', 'src', 'ggml-metal')
     ]
-    
+
     # Bestehende Pfade beibehalten
     existing_paths = os.environ.get('DYLD_LIBRARY_PATH', '').split(':')
     if existing_paths == ['']:
         existing_paths = []
-    
+
     # Neue Pfade hinzufuegen und doppelte vermeiden
     for path in whisper_lib_paths:
         if os.path.exists(path) and path not in existing_paths:
             existing_paths.append(path)
-    
+
     # Umgebungsvariable aktualisieren
     os.environ['DYLD_LIBRARY_PATH'] = ':'.join(existing_paths)
 
-    # Alter Workaround entfernt - nicht mehr benötigt da lokale Pfade verwendet werden
+
+_init_dyld_paths()
 
 
+import atexit
+import hashlib
 import json
 import os
 import platform
-import requests
+import re
 import subprocess
 import tempfile
-import json
 import shutil
-import psutil
+import stat
+import selectors
+import signal
 import threading
-import queue
 import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Optional, Dict, List, Union, Tuple
 from enum import Enum
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+except ImportError:  # orjson ist optional; Fallback auf das stdlib-json
+    orjson = None
+
 from ..core.config import load_config
-from ..core.events import publish, EventType
+from ..core.events import publish, publish_coalesced, EventType
 from ..core.utils import ensure_directory_exists
 from ..core.constants import WHISPER_CPP_MODELS_URL
 from ..core.exceptions import DependencyError, ModelError
@@ -85,44 +99,103 @@ from .whisper_wrapper import parse_whisper_output
 
 logger = get_logger(__name__)
 
+# macOS-Default fuer OPEN_MAX liegt oft bei 10240; close_fds laeuft beim
+# Spawn ueber die ganze FD-Tabelle, also das Soft-Limit moderat halten
+if platform.system() == "Darwin":
+    try:
+        import resource
+        _soft, _hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if _soft > 4096:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (min(4096, _hard), _hard))
+    except (ImportError, ValueError, OSError):
+        pass
+
 # Constants
 WHISPER_CPP_REPO = "https://github.com/ggerganov/whisper.cpp"
 WHISPER_CPP_MODELS_URL = "https://huggingface.co/ggerganov/whisper.cpp/resolve/main"
 DEFAULT_MODEL = WhisperModel.LARGE_V3_TURBO  # Using large-v3-turbo as specified by user
 
-# Global variables to track current transcription process and cancellation
-current_transcription_process = None
+# Aktive Transkriptionsprozesse je Transkriptions-ID; der Lock macht
+# transcribe_audio reentrant für parallele Web-Requests
+_active_processes: Dict[str, subprocess.Popen] = {}
+_active_processes_lock = threading.Lock()
 cancellation_requested = False
 
-def cancel_current_transcription():
-    """Cancel the currently running transcription process."""
-    global current_transcription_process, cancellation_requested
-    
+# Fortschrittsanzeige-Muster von Whisper.cpp, einmal pro Prozess kompiliert.
+# Als Bytes-Muster, damit rohe Pipe-Zeilen ohne UTF-8-Dekodierung geprüft
+# werden können.
+_PROGRESS_RE = re.compile(rb'\[\s*([0-9]+)%\]')
+
+# Dateiendungs-Mengen fuer die Eingangserkennung; frozenset-Lookup statt
+# linearem endswith-Scan mit wiederholtem lower()
+_VIDEO_EXTS = frozenset({".mp4", ".avi", ".mov", ".mkv", ".flv", ".webm"})
+_OPUS_EXTS = frozenset({".opus"})
+
+# Whisper-Ausgabezeilen nur auf Wunsch ins Terminal spiegeln; das
+# print(flush=True) pro Zeile kostet sonst einen write-Syscall im
+# heissen Pipe-Loop
+_DEBUG_PRINT = os.environ.get("WHISPER_TOOL_DEBUG_PRINT", "").lower() in ("1", "true", "yes")
+
+# Bekannte SHA-256-Pruefsummen der ggml-Modelle (aus den auf Hugging Face
+# veroeffentlichten Summen pflegen). Fehlt der Eintrag, wird der Download
+# nicht verifiziert.
+_MODEL_SHA256: Dict[str, str] = {}
+
+# Verzeichnisse, deren Existenz bereits sichergestellt wurde
+_ensured_model_dirs = set()
+
+def cancel_current_transcription(transcription_id: Optional[str] = None):
+    """Cancel running transcription processes.
+
+    Args:
+        transcription_id: ID einer einzelnen Transkription; ohne Angabe
+            werden alle aktiven Prozesse abgebrochen.
+    """
+    global cancellation_requested
+
     # Set cancellation flag
     cancellation_requested = True
-    logger.info(f"Cancel requested, current process: {current_transcription_process}")
-    
-    # Cancel active process if exists
-    if current_transcription_process and current_transcription_process.poll() is None:
-        logger.info(f"Cancelling current transcription process PID: {current_transcription_process.pid}")
-        current_transcription_process.terminate()
+
+    with _active_processes_lock:
+        if transcription_id is not None:
+            processes = {k: v for k, v in _active_processes.items() if k == transcription_id}
+        else:
+            processes = dict(_active_processes)
+    logger.info(f"Cancel requested, active processes: {list(processes)}")
+
+    cancelled = False
+    for proc_id, process in processes.items():
+        if process.poll() is not None:
+            continue
+        logger.info(f"Cancelling transcription {proc_id}, PID: {process.pid}")
+        # Dank start_new_session ist der Prozess sein eigener
+        # Gruppenfuehrer; killpg raeumt auch Kindprozesse mit ab
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except (ProcessLookupError, PermissionError, OSError):
+            process.terminate()
         try:
-            current_transcription_process.wait(timeout=5)
+            process.wait(timeout=5)
             logger.info("Process terminated successfully")
         except subprocess.TimeoutExpired:
             logger.warning("Process didn't terminate, killing it")
-            current_transcription_process.kill()
-            current_transcription_process.wait()
-        current_transcription_process = None
-        
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError, OSError):
+                process.kill()
+            process.wait()
+        with _active_processes_lock:
+            _active_processes.pop(proc_id, None)
+        cancelled = True
+
+    if cancelled:
         # Send cancel event
         publish(EventType.CUSTOM, {
             "type": "TRANSCRIPTION_CANCELLED",
             "message": "Transkription wurde abgebrochen"
         })
         return True
-    else:
-        logger.warning("No active transcription process to cancel")
+    logger.warning("No active transcription process to cancel")
     return cancellation_requested
 
 # Modellgrößen in MB und geschätzter RAM-Bedarf in MB
@@ -139,43 +212,61 @@ MODEL_SIZES = {
     "large-v3-turbo": {"disk": 1500, "ram": 3000}
 }
 
+def _first_executable(paths) -> Optional[str]:
+    """Erster regulärer, ausführbarer Pfad aus der Kandidatenliste.
+
+    Ein os.stat pro Kandidat statt os.path.exists + os.access; der
+    Mode-Check ersetzt access(2), das je nach Kernel zusätzlich das
+    Elternverzeichnis prüft.
+    """
+    for path in paths:
+        if not path:
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode) and st.st_mode & 0o111:
+            return path
+    return None
+
+
+@lru_cache(maxsize=2)
+def _which_whisper() -> Optional[str]:
+    """Single cached PATH sweep for the whisper binaries."""
+    return _first_executable(
+        shutil.which(binary_name) for binary_name in ("whisper", "whisper-cli")
+    )
+
+
 def check_whisper_cpp_installed(binary_path: Optional[str] = None) -> bool:
     """
     Check if Whisper.cpp is installed.
-    
+
     Args:
         binary_path: Path to whisper binary
-        
+
     Returns:
         True if installed, False otherwise
     """
     if binary_path and os.path.exists(binary_path):
         return True
-    
-    return check_program_exists("whisper") or check_program_exists("./whisper")
 
+    return _which_whisper() is not None
+
+
+@lru_cache(maxsize=8)
+def _resolve_whisper_binary(binary_path_hint: Optional[str]) -> str:
+    """Resolve the whisper binary once per hint; the candidate sweep
+    costs a dozen stat calls, so the result is memoized."""
+    if binary_path_hint and os.path.exists(binary_path_hint):
+        return binary_path_hint
 
-def get_whisper_binary_path(config: Optional[Dict] = None) -> str:
-    """
-    Get the path to the Whisper.cpp binary.
-    
-    Args:
-        config: Configuration dictionary
-        
-    Returns:
-        Path to whisper binary
-    """
-    if config and "whisper" in config and "binary_path" in config["whisper"]:
-        binary_path = config["whisper"]["binary_path"]
-        if os.path.exists(binary_path):
-            return binary_path
-    
     # Check if whisper is in PATH (both whisper and whisper-cli names)
-    for binary_name in ("whisper", "whisper-cli"):
-        whisper_path = shutil.which(binary_name)
-        if whisper_path and os.access(whisper_path, os.X_OK):
-            return whisper_path
-    
+    whisper_path = _which_whisper()
+    if whisper_path:
+        return whisper_path
+
     # Check common locations
     repo_root = Path(__file__).resolve().parents[3]
     common_locations = [
@@ -192,42 +283,144 @@ def get_whisper_binary_path(config: Optional[Dict] = None) -> str:
         str(Path.home() / "whisper.cpp" / "whisper"),
         str(Path.home() / "whisper.cpp" / "build" / "bin" / "whisper-cli")
     ]
-    
-    for location in common_locations:
-        if os.path.exists(location) and os.access(location, os.X_OK):
-            return location
-    
+
+    location = _first_executable(common_locations)
+    if location:
+        return location
+
     raise DependencyError(dependency="Whisper.cpp")
 
 
-def get_model_path(model_name: str, config: Optional[Dict] = None) -> str:
+@lru_cache(maxsize=4)
+def _whisper_caps(binary_path: str) -> Dict[str, bool]:
+    """Einmalige Faehigkeitsprobe des whisper-Binaries via --help.
+
+    Apple-Silicon-Builds von whisper.cpp mit libavformat lesen Opus
+    direkt; in dem Fall kann die ffmpeg-Zwischenkonvertierung entfallen.
     """
-    Get the path to a Whisper model.
-    
+    try:
+        result = subprocess.run(
+            [binary_path, "--help"], capture_output=True, timeout=10
+        )
+        help_text = (result.stdout + result.stderr).decode("utf-8", "replace").lower()
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.debug(f"Faehigkeitsprobe fuer {binary_path} fehlgeschlagen: {e}")
+        help_text = ""
+
+    return {"opus_native": "ffmpeg" in help_text or "opus" in help_text}
+
+
+def get_whisper_binary_path(config: Optional[Dict] = None) -> str:
+    """
+    Get the path to the Whisper.cpp binary.
+
     Args:
-        model_name: Name of the model
         config: Configuration dictionary
-        
+
     Returns:
-        Path to model file
+        Path to whisper binary
     """
-    # Get models directory from config
-    models_dir = str(Path.home() / "whisper_models")
-    if config and "whisper" in config and "model_path" in config["whisper"]:
-        models_dir = config["whisper"]["model_path"]
-    
-    # Ensure models directory exists
+    binary_path_hint = None
+    if config and "whisper" in config and "binary_path" in config["whisper"]:
+        binary_path_hint = config["whisper"]["binary_path"]
+
+    return _resolve_whisper_binary(binary_path_hint)
+
+
+@lru_cache(maxsize=32)
+def _ensured_models_dir(models_dir: str) -> str:
+    """mkdir -p des Modellverzeichnisses, einmal pro Pfad gecacht."""
     ensure_directory_exists(models_dir)
-    
-    # Check if model file exists
+    return models_dir
+
+
+def _resolve_model_path(models_dir: str, model_name: str) -> str:
+    """Resolve a model file path.
+
+    The existence check runs on every call (one cheap stat): a model
+    deleted or downloaded at runtime must be picked up immediately, so
+    only the directory creation is cached.
+    """
+    _ensured_models_dir(models_dir)
+
     model_path = os.path.join(models_dir, f"ggml-{model_name}.bin")
     if os.path.exists(model_path):
         return model_path
-    
-    # If not, raise an error (download_model should be called separately)
+
     raise ModelError(f"Model {model_name} not found at {model_path}. Please download it first.")
 
 
+@lru_cache(maxsize=16)
+def _models_dir_cached(model_path_override: Optional[str]) -> str:
+    """Aufgeloestes Modellverzeichnis je Konfigurationswert (memoisiert)."""
+    return model_path_override or str(Path.home() / "whisper_models")
+
+
+def _models_dir(config: Optional[Dict], ensure: bool = False) -> str:
+    """Einzige Quelle fuer das Modellverzeichnis.
+
+    Ersetzt die dreifach duplizierte Default/Override-Logik in
+    get_model_path, download_model und list_models; mit ensure=True wird
+    die Existenz pro Verzeichnis nur einmal sichergestellt.
+    """
+    override = (config or {}).get("whisper", {}).get("model_path")
+    models_dir = _models_dir_cached(override)
+    if ensure and models_dir not in _ensured_model_dirs:
+        ensure_directory_exists(models_dir)
+        _ensured_model_dirs.add(models_dir)
+    return models_dir
+
+
+def get_model_path(model_name: str, config: Optional[Dict] = None) -> str:
+    """
+    Get the path to a Whisper model.
+
+    Args:
+        model_name: Name of the model
+        config: Configuration dictionary
+
+    Returns:
+        Path to model file
+    """
+    return _resolve_model_path(_models_dir(config), model_name)
+
+
+# 1-Sekunden-Cache für die RAM-Abfrage; vm_stat/meminfo sind deutlich
+# billiger als psutil.virtual_memory(), aber auch nicht gratis
+_MEM_CACHE = {"ts": 0.0, "avail_mb": None}
+_VMSTAT_PAGE_RE = re.compile(rb'Pages (?:free|inactive|speculative):\s+(\d+)')
+
+
+def _available_ram_mb() -> float:
+    """Verfügbaren RAM in MB ermitteln (1 s gecacht).
+
+    Auf macOS werden freie, inaktive und spekulative Seiten aus vm_stat
+    summiert; auf Linux wird MemAvailable aus /proc/meminfo gelesen.
+    """
+    now = time.monotonic()
+    if _MEM_CACHE["avail_mb"] is not None and now - _MEM_CACHE["ts"] < 1.0:
+        return _MEM_CACHE["avail_mb"]
+
+    if sys.platform == "darwin":
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        out = subprocess.run(["vm_stat"], capture_output=True, check=True).stdout
+        pages = sum(int(n) for n in _VMSTAT_PAGE_RE.findall(out))
+        avail_mb = pages * page_size / (1024 * 1024)
+    else:
+        avail_mb = None
+        with open("/proc/meminfo", "rb") as f:
+            for line in f:
+                if line.startswith(b"MemAvailable:"):
+                    avail_mb = int(line.split()[1]) / 1024  # kB -> MB
+                    break
+        if avail_mb is None:
+            raise RuntimeError("MemAvailable nicht in /proc/meminfo gefunden")
+
+    _MEM_CACHE["ts"] = now
+    _MEM_CACHE["avail_mb"] = avail_mb
+    return avail_mb
+
+
 def check_memory_for_model(model_name: str) -> Tuple[bool, str]:
     """
     Überprüft, ob genügend Speicher für das gewählte Modell verfügbar ist.
@@ -252,7 +445,7 @@ def check_memory_for_model(model_name: str) -> Tuple[bool, str]:
     # Verfügbaren Speicher prüfen
     try:
         # Verfügbarer Speicher in MB
-        available_ram = psutil.virtual_memory().available / (1024 * 1024)
+        available_ram = _available_ram_mb()
         
         logger.info(f"Verfügbarer RAM: {available_ram:.2f} MB, Benötigt für Modell {model_name}: {required_ram} MB")
         
@@ -283,14 +476,9 @@ def download_model(model_name: str, config: Optional[Dict] = None) -> str:
     if not has_enough_memory:
         raise ModelError(f"Speicherprüfung fehlgeschlagen: {message}")
     
-    # Get models directory from config
-    models_dir = str(Path.home() / "whisper_models")
-    if config and "whisper" in config and "model_path" in config["whisper"]:
-        models_dir = config["whisper"]["model_path"]
-    
-    # Ensure models directory exists
-    ensure_directory_exists(models_dir)
-    
+    # Get models directory from config (Existenz einmalig sichergestellt)
+    models_dir = _models_dir(config, ensure=True)
+
     # Construct model path and URL
     model_path = os.path.join(models_dir, f"ggml-{model_name}.bin")
     model_url = f"{WHISPER_CPP_MODELS_URL}/ggml-{model_name}.bin"
@@ -300,92 +488,345 @@ def download_model(model_name: str, config: Optional[Dict] = None) -> str:
         logger.info(f"Model {model_name} already exists at {model_path}")
         return model_path
     
+    # requests erst hier importieren: zieht certifi/urllib3 nach und
+    # wuerde sonst jeden Modulimport verlangsamen
+    import requests
+
     # Download model
     logger.info(f"Downloading model {model_name} from {model_url}")
     publish(EventType.MODEL_DOWNLOAD_STARTED, {"model": model_name, "url": model_url})
-    
+
+    # Abgebrochene Downloads werden über eine .part-Datei per HTTP-Range
+    # fortgesetzt; das ETag-Sidecar schützt über If-Range davor, an eine
+    # inzwischen geänderte Remote-Datei anzuhängen.
+    part_path = model_path + ".part"
+    etag_path = model_path + ".etag"
+
     try:
-        with requests.get(model_url, stream=True) as r:
+        headers = {}
+        existing = 0
+        if os.path.exists(part_path):
+            existing = os.path.getsize(part_path)
+            if existing > 0:
+                headers["Range"] = f"bytes={existing}-"
+                if os.path.exists(etag_path):
+                    with open(etag_path, "r", encoding="utf-8") as f:
+                        etag = f.read().strip()
+                    if etag:
+                        headers["If-Range"] = etag
+
+        with requests.get(model_url, stream=True, headers=headers) as r:
             r.raise_for_status()
-            total_size = int(r.headers.get('content-length', 0))
-            
-            with open(model_path, 'wb') as f:
+
+            if r.status_code == 206:
+                logger.info(f"Setze Download bei Byte {existing} fort")
+                mode = "ab"
+                downloaded = existing
+                total_size = existing + int(r.headers.get('content-length', 0))
+            else:
+                # Server liefert die ganze Datei (kein Range-Support oder
+                # Remote-Datei geändert) — von vorn beginnen
+                mode = "wb"
                 downloaded = 0
+                total_size = int(r.headers.get('content-length', 0))
+
+            if r.headers.get("ETag"):
+                with open(etag_path, "w", encoding="utf-8") as f:
+                    f.write(r.headers["ETag"])
+
+            # SHA-256 waehrend des Streams mitrechnen (hashlib gibt den
+            # GIL frei); erspart einen zweiten kompletten Lesedurchgang.
+            # Beim Resume erst den vorhandenen Prefix nachhashen.
+            hasher = hashlib.sha256()
+            if mode == "ab":
+                with open(part_path, "rb") as f:
+                    for block in iter(lambda: f.read(1 << 23), b""):
+                        hasher.update(block)
+
+            with open(part_path, mode) as f:
                 for chunk in r.iter_content(chunk_size=8192):
                     if chunk:
+                        hasher.update(chunk)
                         f.write(chunk)
                         downloaded += len(chunk)
-                        
-                        # Report progress
+
+                        # Report progress (coalesced; fires per 8 KiB chunk)
                         if total_size > 0:
                             progress = (downloaded / total_size) * 100
-                            publish(EventType.PROGRESS_UPDATE, {
+                            publish_coalesced(EventType.PROGRESS_UPDATE, {
                                 "task": "model_download",
                                 "progress": progress,
                                 "model": model_name
                             })
-        
+
+        if total_size > 0 and downloaded != total_size:
+            raise ModelError(
+                f"Unvollständiger Download: {downloaded} von {total_size} Bytes"
+            )
+
+        expected_sha = _MODEL_SHA256.get(model_name)
+        if expected_sha and hasher.hexdigest() != expected_sha:
+            os.unlink(part_path)
+            raise ModelError(
+                f"SHA-256-Pruefung fuer {model_name} fehlgeschlagen: "
+                f"{hasher.hexdigest()} != {expected_sha}"
+            )
+
+        os.replace(part_path, model_path)
         logger.info(f"Model {model_name} downloaded to {model_path}")
         publish(EventType.MODEL_DOWNLOAD_COMPLETED, {"model": model_name, "path": model_path})
         return model_path
-    
+
     except Exception as e:
+        # .part-Datei für den nächsten Resume-Versuch liegen lassen
         logger.error(f"Error downloading model {model_name}: {e}")
         publish(EventType.MODEL_DOWNLOAD_FAILED, {"model": model_name, "error": str(e)})
         raise ModelError(f"Failed to download model {model_name}: {e}")
 
 
+# Modelle, fuer die bereits ein Readahead angestossen wurde
+_warmed_models = set()
+_warmed_models_lock = threading.Lock()
+
+
+def _warm_model(model_path: str):
+    """Stosse Kernel-Readahead fuer die Modelldatei an (einmal pro Pfad).
+
+    Laeuft in einem Daemon-Thread, damit das Einlesen der 1,5-3 GB
+    Gewichte mit der restlichen Vorbereitung (ffmpeg, Kommandoaufbau)
+    ueberlappt statt beim ersten whisper.cpp-Start zu blockieren.
+    """
+    with _warmed_models_lock:
+        if model_path in _warmed_models:
+            return
+        _warmed_models.add(model_path)
+
+    def _advise():
+        try:
+            fd = os.open(model_path, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                elif platform.system() == "Darwin":
+                    import fcntl
+                    import struct
+                    # struct radvisory { off_t ra_offset; int ra_count; }
+                    chunk = 1 << 30
+                    offset = 0
+                    while offset < size:
+                        count = min(chunk, size - offset)
+                        fcntl.fcntl(fd, fcntl.F_RDADVISE,
+                                    struct.pack("qi", offset, count))
+                        offset += count
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.debug(f"Modell-Readahead fehlgeschlagen fuer {model_path}: {e}")
+
+    threading.Thread(target=_advise, daemon=True).start()
+
+
+class _WhisperDaemon:
+    """Hält einen whisper-server-Prozess mit geladenem Modell am Leben.
+
+    Jeder whisper-cli-Aufruf lädt das 1,5-3 GB große Modell neu und
+    kompiliert die Metal-Kernel; ein residenter Server zahlt diese
+    Kosten nur einmal pro Modell. Fehlt das Server-Binary oder schlägt
+    eine Anfrage fehl, fällt transcribe_audio auf den Popen-Pfad zurück.
+    """
+
+    def __init__(self):
+        self.proc: Optional[subprocess.Popen] = None
+        self.model_path: Optional[str] = None
+        self.port: Optional[int] = None
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _find_server_binary(config: Optional[Dict] = None) -> Optional[str]:
+        """Suche whisper-server neben dem whisper-cli-Binary oder im PATH."""
+        try:
+            cli_path = get_whisper_binary_path(config)
+            candidate = os.path.join(os.path.dirname(cli_path), "whisper-server")
+            if os.path.exists(candidate) and os.access(candidate, os.X_OK):
+                return candidate
+        except DependencyError:
+            pass
+        return shutil.which("whisper-server")
+
+    def ensure_running(self, model_path: str, config: Optional[Dict] = None) -> bool:
+        """Starte den Server bei Bedarf (neu) mit dem gewünschten Modell."""
+        with self.lock:
+            if (self.proc is not None and self.proc.poll() is None
+                    and self.model_path == model_path):
+                return True
+
+            self._shutdown_locked()
+
+            binary = self._find_server_binary(config)
+            if not binary:
+                return False
+
+            # Freien Port vom Betriebssystem geben lassen
+            import socket
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.bind(("127.0.0.1", 0))
+                port = s.getsockname()[1]
+
+            logger.info(f"Starte whisper-server mit Modell {model_path} auf Port {port}")
+            try:
+                self.proc = subprocess.Popen(
+                    [binary, "-m", model_path, "--host", "127.0.0.1",
+                     "--port", str(port)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+            except OSError as e:
+                logger.warning(f"whisper-server konnte nicht gestartet werden: {e}")
+                self.proc = None
+                return False
+
+            # Warten bis der Server den Port annimmt (Modell-Load kann dauern)
+            deadline = time.time() + 60
+            while time.time() < deadline:
+                if self.proc.poll() is not None:
+                    logger.warning("whisper-server hat sich sofort beendet")
+                    self.proc = None
+                    return False
+                try:
+                    with socket.create_connection(("127.0.0.1", port), timeout=1.0):
+                        break
+                except OSError:
+                    time.sleep(0.25)
+            else:
+                logger.warning("whisper-server wurde nicht rechtzeitig bereit")
+                self._shutdown_locked()
+                return False
+
+            self.model_path = model_path
+            self.port = port
+            return True
+
+    def transcribe(self, audio_path: str, language: Optional[str] = None) -> Dict:
+        """Transkribiere eine Datei über den residenten Server."""
+        import requests
+
+        url = f"http://127.0.0.1:{self.port}/inference"
+        data = {"response_format": "verbose_json"}
+        if language:
+            data["language"] = language
+        with open(audio_path, "rb") as f:
+            response = requests.post(
+                url,
+                files={"file": (os.path.basename(audio_path), f)},
+                data=data,
+                timeout=3600
+            )
+        response.raise_for_status()
+        return response.json()
+
+    def _shutdown_locked(self):
+        if self.proc is not None and self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+        self.proc = None
+        self.model_path = None
+        self.port = None
+
+    def shutdown(self):
+        """Beende den Serverprozess (atexit-Hook)."""
+        with self.lock:
+            self._shutdown_locked()
+
+
+_whisper_daemon = _WhisperDaemon()
+atexit.register(_whisper_daemon.shutdown)
+
+
+# Muster fuer Modelldateien, einmal pro Prozess kompiliert
+_MODEL_RE = re.compile(r'^ggml-(.+)\.bin\Z')
+
+
 def list_models(config: Optional[Dict] = None) -> List[str]:
     """
     List available Whisper models.
-    
+
     Args:
         config: Configuration dictionary
-        
+
     Returns:
         List of available model names
     """
-    # Get models directory from config
-    models_dir = str(Path.home() / "whisper_models")
-    if config and "whisper" in config and "model_path" in config["whisper"]:
-        models_dir = config["whisper"]["model_path"]
-    
-    # Ensure models directory exists
-    ensure_directory_exists(models_dir)
-    
-    # List model files
-    model_files = []
-    for file in os.listdir(models_dir):
-        if file.startswith("ggml-") and file.endswith(".bin"):
-            model_name = file[5:-4]  # Remove "ggml-" prefix and ".bin" suffix
-            model_files.append(model_name)
-    
-    return model_files
+    # Get models directory from config (Existenz einmalig sichergestellt)
+    models_dir = _models_dir(config, ensure=True)
+
+    # List model files via scandir; skips .part/.download leftovers,
+    # hidden files and anything that is not a regular file
+    with os.scandir(models_dir) as it:
+        return [
+            m.group(1)
+            for e in it
+            if (m := _MODEL_RE.match(e.name)) and e.is_file(follow_symlinks=False)
+        ]
 
 
-def _stream_reader(stream, output_queue, stream_name, logger):
+def _json_dumps_bytes(data, indent: bool = True) -> bytes:
+    """Serialisiere nach JSON-Bytes; orjson (C-implementiert) wenn verfuegbar.
+
+    Bei grossen Segmentlisten ist orjson um ein Vielfaches schneller als
+    das stdlib-json; das Ergebnis wird direkt binaer geschrieben, ohne
+    TextIOWrapper.
     """
-    Thread-safe helper function to read from a subprocess stream without blocking.
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
 
-    This prevents PIPE buffer deadlocks by continuously draining stdout/stderr
-    in separate threads, regardless of how much output the subprocess produces.
 
-    Args:
-        stream: The subprocess.PIPE stream to read from
-        output_queue: Thread-safe queue to write lines to
-        stream_name: Name for logging (e.g., "stdout" or "stderr")
-        logger: Logger instance for debug output
+def _load_whisper_json(temp_dir: str) -> Optional[Tuple[str, List[Dict]]]:
+    """Lese output.json und normalisiere auf (text, segments).
+
+    Unterstuetzt sowohl das whisper.cpp-Format (-oj, "transcription" mit
+    Offsets in Millisekunden) als auch das vom Server-Pfad geschriebene
+    Format mit "segments" in Sekunden.
     """
+    json_path = os.path.join(temp_dir, "output.json")
+    if not os.path.exists(json_path):
+        return None
+
     try:
-        for line in iter(stream.readline, ''):
-            if line:
-                output_queue.put((stream_name, line))
-        stream.close()
-    except Exception as e:
-        logger.error(f"Error reading from {stream_name}: {e}")
-    finally:
-        # Signal that this stream is done
-        output_queue.put((stream_name, None))
+        with open(json_path, "rb") as f:
+            raw = f.read()
+        # orjson parst die teils zweistellig grossen Segmentlisten um ein
+        # Mehrfaches schneller als das stdlib-json
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Konnte output.json nicht lesen: {e}")
+        return None
+
+    if "segments" in data:
+        segments = data["segments"]
+        text = data.get("text") or "".join(s.get("text", "") for s in segments)
+        return text, segments
+
+    if "transcription" in data:
+        segments = [
+            {
+                "text": entry.get("text", ""),
+                "start": entry.get("offsets", {}).get("from", 0) / 1000.0,
+                "end": entry.get("offsets", {}).get("to", 0) / 1000.0,
+            }
+            for entry in data["transcription"]
+        ]
+        text = "".join(s["text"] for s in segments)
+        return text, segments
+
+    return None
 
 
 def transcribe_audio(
@@ -398,7 +839,8 @@ def transcribe_audio(
     srt_max_chars: Optional[int] = None,
     srt_max_duration: Optional[float] = None,
     srt_linebreaks: bool = True,
-    config: Optional[Dict] = None
+    config: Optional[Dict] = None,
+    temp_dir: Optional[Union[str, Path]] = None
 ) -> TranscriptionResult:
     """
     Transcribe an audio file using Whisper.cpp.
@@ -413,7 +855,9 @@ def transcribe_audio(
         srt_max_chars: Max chars per subtitle segment for SRT
         srt_max_duration: Max duration per subtitle segment in seconds
         config: Configuration dictionary
-        
+        temp_dir: Arbeitsverzeichnis fuer Zwischendateien (ueberschreibt
+            die Konfiguration; genutzt fuer isolierte Chunk-Laeufe)
+
     Returns:
         TranscriptionResult object
     """
@@ -436,61 +880,85 @@ def transcribe_audio(
         return TranscriptionResult(success=False, error=error_msg)
 
     # Generate transcription ID for tracking
-    import uuid
     transcription_id = str(uuid.uuid4())[:8]
 
-    # Check if file is Opus and convert to MP3 if needed
+    # Gemeinsame Basis fuer PROGRESS_UPDATE-Payloads; {**base, ...} kopiert
+    # das Dict auf C-Ebene statt jeden Schluessel einzeln zu setzen
+    progress_base = {
+        'task': 'transcription',
+        'audio_path': audio_path,
+        'user_id': transcription_id
+    }
+
+    # Check if file is Opus and convert to WAV if needed
     original_audio_path = audio_path
-    if audio_path.lower().endswith('.opus'):
-        logger.info(f"Detected Opus file, converting to MP3...")
-        publish(EventType.PROGRESS_UPDATE, {
-            'task': 'transcription',
-            'status': 'Konvertiere Opus zu MP3...',
-            'progress': 1,
-            'user_id': transcription_id,
-            'phase': 'conversion'
-        })
+    if os.path.splitext(audio_path)[1].lower() in _OPUS_EXTS:
+        # Liest das Binary Opus nativ (libavformat), entfaellt die
+        # Zwischenkonvertierung samt ffmpeg-Prozess und Temp-Datei.
+        # Nur bei explizitem Opt-in (config["whisper"]["native_opus"]):
+        # die --help-Probe ist eine Substring-Heuristik, ein falsches
+        # Positiv liesse die Transkription ohne Konvertierungs-Retry
+        # hart scheitern.
+        opus_native = False
+        if config.get("whisper", {}).get("native_opus", False):
+            try:
+                opus_native = _whisper_caps(get_whisper_binary_path(config))["opus_native"]
+            except DependencyError:
+                pass
 
-        try:
-            from ..module2_extract.ffmpeg_wrapper import detect_ffmpeg, convert_opus_to_mp3
+        if opus_native:
+            logger.info("whisper.cpp liest Opus nativ, ueberspringe Konvertierung")
+        else:
+            logger.info(f"Detected Opus file, converting to WAV...")
+            publish(EventType.PROGRESS_UPDATE, {
+                **progress_base,
+                'status': 'Konvertiere Opus zu WAV...',
+                'progress': 1,
+                'phase': 'conversion'
+            })
 
-            # Find FFmpeg
-            ffmpeg_path = detect_ffmpeg()
-            if not ffmpeg_path:
-                error_msg = "FFmpeg nicht gefunden. Benötigt für Opus-Konvertierung."
-                logger.error(error_msg)
-                return TranscriptionResult(success=False, error=error_msg)
+            try:
+                from ..module2_extract.ffmpeg_wrapper import detect_ffmpeg, convert_opus_to_wav
 
-            # Create temp MP3 file
-            temp_dir = config.get("output", {}).get("temp_directory", tempfile.gettempdir())
-            ensure_directory_exists(temp_dir)
+                # Find FFmpeg
+                ffmpeg_path = detect_ffmpeg()
+                if not ffmpeg_path:
+                    error_msg = "FFmpeg nicht gefunden. Benötigt für Opus-Konvertierung."
+                    logger.error(error_msg)
+                    return TranscriptionResult(success=False, error=error_msg)
 
-            mp3_filename = os.path.splitext(os.path.basename(audio_path))[0] + '.mp3'
-            mp3_path = os.path.join(temp_dir, mp3_filename)
+                # Create temp WAV file (16 kHz mono; Whisper resampelt intern,
+                # ein MP3-Encode waere verschenkte Arbeit)
+                wav_temp_dir = str(temp_dir) if temp_dir is not None else \
+                    config.get("output", {}).get("temp_directory", tempfile.gettempdir())
+                ensure_directory_exists(wav_temp_dir)
 
-            # Convert Opus to MP3
-            returncode, stdout, stderr = convert_opus_to_mp3(ffmpeg_path, audio_path, mp3_path)
+                wav_filename = os.path.splitext(os.path.basename(audio_path))[0] + '.wav'
+                wav_path = os.path.join(wav_temp_dir, wav_filename)
 
-            if returncode != 0:
-                error_msg = f"Opus zu MP3 Konvertierung fehlgeschlagen: {stderr}"
-                logger.error(error_msg)
-                return TranscriptionResult(success=False, error=error_msg)
+                # Convert Opus to WAV
+                returncode, stdout, stderr = convert_opus_to_wav(ffmpeg_path, audio_path, wav_path)
 
-            # Use converted MP3 for transcription
-            audio_path = mp3_path
-            logger.info(f"Opus erfolgreich zu MP3 konvertiert: {mp3_path}")
+                if returncode != 0:
+                    error_msg = f"Opus zu WAV Konvertierung fehlgeschlagen: {stderr}"
+                    logger.error(error_msg)
+                    return TranscriptionResult(success=False, error=error_msg)
 
-        except Exception as e:
-            error_msg = f"Fehler bei Opus-Konvertierung: {str(e)}"
-            logger.error(error_msg)
-            return TranscriptionResult(success=False, error=error_msg)
+                # Use converted WAV for transcription
+                audio_path = wav_path
+                progress_base['audio_path'] = audio_path
+                logger.info(f"Opus erfolgreich zu WAV konvertiert: {wav_path}")
+
+            except Exception as e:
+                error_msg = f"Fehler bei Opus-Konvertierung: {str(e)}"
+                logger.error(error_msg)
+                return TranscriptionResult(success=False, error=error_msg)
     
     # Sende initiale Status-Nachricht
     publish(EventType.PROGRESS_UPDATE, {
-        'task': 'transcription',
+        **progress_base,
         'status': 'Initialisiere Transkription...',
         'progress': 0,
-        'user_id': transcription_id,
         'phase': 'initialization'
     })
     
@@ -499,10 +967,9 @@ def transcribe_audio(
     
     # Analysiere Audio-Datei
     publish(EventType.PROGRESS_UPDATE, {
-        'task': 'transcription',
+        **progress_base,
         'status': 'Analysiere Audio-Datei...',
         'progress': 2,
-        'user_id': transcription_id,
         'phase': 'analyzing'
     })
     
@@ -582,16 +1049,35 @@ def transcribe_audio(
         except ModelError:
             logger.info(f"Model {model.value} not found, downloading...")
             model_path = download_model(model.value, config)
-        
-        # Prepare command
+
+        # Readahead im Hintergrund, waehrend wir noch vorbereiten
+        _warm_model(model_path)
+
+        # Prepare command: nur JSON schreiben lassen; TXT/SRT/VTT werden
+        # in Python aus den Segmenten formatiert statt als zusätzliche
+        # Dateien von whisper.cpp geschrieben und wieder eingelesen
         cmd = [
             whisper_path,
             "-m", model_path,
             "-f", audio_path,
-            "-otxt",
-            "-osrt"  # Die `-ojson` Option wird nicht unterstützt
+            "-oj"
         ]
-        
+
+        # whisper.cpp kann SRT direkt schreiben, aber ohne die eigene
+        # Re-Segmentierung (segments_to_srt wendet auch bei None-Parametern
+        # die Kurzuntertitel-Defaults an). Der native Pfad ist daher
+        # ausdrückliches Opt-in über config["whisper"]["native_srt"] und
+        # greift nur, wenn keine Formatierungsparameter gesetzt sind.
+        native_srt = (
+            output_format == OutputFormat.SRT
+            and config.get("whisper", {}).get("native_srt", False)
+            and srt_max_chars is None
+            and srt_max_duration is None
+            and srt_linebreaks is True
+        )
+        if native_srt:
+            cmd.append("-osrt")
+
         # Add language if specified
         if language:
             cmd.extend(["-l", language])
@@ -605,25 +1091,22 @@ def transcribe_audio(
         
         # Verwende das konfigurierte temporäre Verzeichnis
         system_temp = False
-        if "output" in config and "temp_directory" in config["output"]:
+        if temp_dir is not None:
+            # Vom Aufrufer vorgegebenes Arbeitsverzeichnis (z. B. pro Chunk
+            # in transcribe_audio_chunked) — verhindert, dass parallele
+            # Laeufe sich gegenseitig output.json/output.txt ueberschreiben
+            temp_dir = str(temp_dir)
+            os.makedirs(temp_dir, exist_ok=True)
+            logger.info(f"Verwende uebergebenes Temp-Verzeichnis: {temp_dir}")
+        elif "output" in config and "temp_directory" in config["output"]:
             temp_dir = config["output"]["temp_directory"]
             # Stelle sicher, dass das Verzeichnis existiert
             os.makedirs(temp_dir, exist_ok=True)
             logger.info(f"Verwende konfiguriertes Temp-Verzeichnis: {temp_dir}")
         else:
             # Fallback: Erstelle ein temporäres Verzeichnis im Projektordner
-            # Ermittle das Projektverzeichnis
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            # Navigiere zu src
-            while current_dir and not os.path.basename(current_dir) == 'src':
-                parent_dir = os.path.dirname(current_dir)
-                if parent_dir == current_dir:
-                    break
-                current_dir = parent_dir
-            # Projektverzeichnis ist eine Ebene höher als src
-            project_dir = os.path.dirname(current_dir) if os.path.basename(current_dir) == 'src' else os.path.dirname(os.path.abspath(__file__))
-            # Erstelle Temp-Verzeichnis im Projektordner
-            temp_dir = os.path.join(project_dir, "transcriptions", "temp")
+            # (Projektwurzel ist als Konstante vorberechnet)
+            temp_dir = os.path.join(_REPO_ROOT, "transcriptions", "temp")
             os.makedirs(temp_dir, exist_ok=True)
             logger.info(f"Fallback-Temp-Verzeichnis erstellt: {temp_dir}")
             # Aktualisiere die Konfiguration
@@ -633,13 +1116,8 @@ def transcribe_audio(
             
         try:
             # Überprüfe, ob die Eingabedatei ein Video ist
-            is_video = False
-            video_extensions = [".mp4", ".avi", ".mov", ".mkv", ".flv", ".webm"]
-            for ext in video_extensions:
-                if audio_path.lower().endswith(ext):
-                    is_video = True
-                    break
-            
+            is_video = os.path.splitext(audio_path)[1].lower() in _VIDEO_EXTS
+
             audio_input_path = audio_path
             temp_audio_path = None
             
@@ -668,9 +1146,11 @@ def transcribe_audio(
                 except Exception as e:
                     logger.warning(f"Fehler bei der Audioextraktion: {e}. Versuche direkte Verarbeitung.")
             
-            # Set the current directory to temp_dir (important for output files)
-            os.chdir(temp_dir)
-            
+            # Kein os.chdir: der Arbeitsverzeichnis-Wechsel ist prozessweit,
+            # nicht threadsicher und wird von cwd=temp_dir im Popen-Aufruf
+            # bereits abgedeckt. Alle Ausgabepfade sind absolut.
+            temp_dir = os.path.abspath(temp_dir)
+
             # Aktualisiere den Whisper-Befehl mit dem richtigen Audioeingabepfad
             for i, arg in enumerate(cmd):
                 if arg == "-f" and i + 1 < len(cmd):
@@ -688,153 +1168,216 @@ def transcribe_audio(
             
             # Status update
             publish(EventType.PROGRESS_UPDATE, {
-                "task": "transcription",
-                "status": "Whisper-Modell wird geladen und Transkription läuft...",
-                "progress": 20
+                **progress_base,
+                'status': 'Whisper-Modell wird geladen und Transkription läuft...',
+                'progress': 20
             })
             
-            # Prozess starten mit Pipes, um Ausgabe in Echtzeit zu lesen
-            process = subprocess.Popen(
-                cmd, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,  # Line-buffered
-                cwd=temp_dir
-            )
-            
-            # Prozess global speichern für Abbruch
-            global current_transcription_process
-            current_transcription_process = process
-            
-            # UUID fu00fcr diese Transkription generieren
-            import uuid
-            transcription_id = str(uuid.uuid4())
-            
-            stdout = []
-            stderr = []
-
-            # Fortschrittsanzeige-Muster (wird von Whisper.cpp ausgegeben)
-            import re
-            progress_pattern = re.compile(r'\[(\s*)([0-9]+)%\]')
-
-            # Thread-safe Queue für Subprocess-Ausgabe
-            output_queue = queue.Queue()
-
-            # Starte separate Threads für stdout und stderr um PIPE Deadlock zu verhindern
-            stdout_thread = threading.Thread(
-                target=_stream_reader,
-                args=(process.stdout, output_queue, "stdout", logger),
-                daemon=True
-            )
-            stderr_thread = threading.Thread(
-                target=_stream_reader,
-                args=(process.stderr, output_queue, "stderr", logger),
-                daemon=True
-            )
-
-            stdout_thread.start()
-            stderr_thread.start()
-
-            # Tracke, ob Streams geschlossen sind
-            streams_done = {"stdout": False, "stderr": False}
-
-            # Timeout-Konfiguration (Standard: 3600 Sekunden = 1 Stunde)
-            process_timeout = 3600
-            process_start_time = time.time()
-
-            # Standard-Ausgabe und Fehlerausgabe in Echtzeit verarbeiten (ohne Deadlock)
-            while not all(streams_done.values()) or not output_queue.empty():
-                # Check für Timeout
-                elapsed_time = time.time() - process_start_time
-                if elapsed_time > process_timeout:
-                    logger.error(f"Subprocess timeout after {process_timeout} seconds. Terminating process.")
-                    process.terminate()
-                    try:
-                        process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        logger.error("Process didn't terminate gracefully, killing it.")
-                        process.kill()
-                        process.wait()
+            # Residenter whisper-server: spart den Modell-Load pro Aufruf.
+            # Opt-in über config["whisper"]["use_server"]: der Server-Pfad
+            # registriert keinen Prozess für cancel_current_transcription,
+            # liefert keine Prozent-Fortschritte und serialisiert parallele
+            # Chunk-Transkriptionen — bis dahin bleibt der CLI-Pfad Standard.
+            daemon_used = False
+            if config.get("whisper", {}).get("use_server", False) and \
+                    _whisper_daemon.ensure_running(model_path, config):
+                try:
+                    server_result = _whisper_daemon.transcribe(audio_input_path, language)
+
+                    # Ausgabedateien wie vom CLI-Pfad erzeugen, damit die
+                    # nachgelagerte Formatkonvertierung unverändert läuft
+                    with open(os.path.join(temp_dir, "output.txt"), "w", encoding="utf-8") as f:
+                        f.write(server_result.get("text", ""))
+                    with open(os.path.join(temp_dir, "output.json"), "wb") as f:
+                        f.write(_json_dumps_bytes({
+                            "text": server_result.get("text", ""),
+                            "segments": server_result.get("segments", [])
+                        }, indent=False))
+
+                    returncode = 0
+                    stdout_text = ""
+                    stderr_text = ""
+                    daemon_used = True
+                except Exception as e:
+                    logger.warning(f"whisper-server-Anfrage fehlgeschlagen, nutze CLI: {e}")
+
+            if not daemon_used:
+                # UUID fu00fcr diese Transkription generieren
+                transcription_id = str(uuid.uuid4())
+                progress_base['user_id'] = transcription_id
+
+                # Prozess starten mit Pipes, um Ausgabe in Echtzeit zu lesen
+                # start_new_session entkoppelt den Whisper-Prozess von
+                # SIGINT an den Server und erlaubt killpg auf die ganze
+                # Prozessgruppe; ohne preexec_fn nutzt CPython posix_spawn
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    cwd=temp_dir,
+                    start_new_session=True
+                )
+
+                # Prozess für Abbruch registrieren (lock-geschützt, damit
+                # parallele Transkriptionen sich nicht überschreiben)
+                with _active_processes_lock:
+                    _active_processes[transcription_id] = process
+
+                # Nur ein rollendes Ende des stdout behalten: das
+                # eigentliche Transkript kommt aus den Output-Dateien,
+                # die Zeilen dienen nur dem Debug-Log
+                stdout_tail = deque(maxlen=200)
+                stderr = []
+
+                # Terminal-Zeilen werden gesammelt und als ein Event pro
+                # Flush verschickt statt als ein Event pro Zeile
+                pending_lines = []
+                last_flush = time.monotonic()
+                last_progress_pct = -1
+
+                def _flush_terminal():
+                    nonlocal last_flush
+                    if pending_lines:
+                        publish_coalesced(EventType.PROGRESS_UPDATE, {
+                            **progress_base,
+                            'terminal_output': b"\n".join(pending_lines).decode("utf-8", "replace")
+                        })
+                        pending_lines.clear()
+                    last_flush = time.monotonic()
 
-                    # Cleanup temporäre Dateien auch bei Timeout
-                    try:
-                        cleanup_after_transcription(audio_path, config)
-                        logger.info(f"Cleaned up temp files after timeout: {audio_path}")
-                    except Exception as e:
-                        logger.warning(f"Failed to cleanup after timeout: {e}")
+                def _handle_line(stream_name, raw_line):
+                    """Verarbeite eine rohe Ausgabezeile des Prozesses.
 
-                    raise TimeoutError(f"Transcription timed out after {process_timeout} seconds")
+                    Das Fortschrittsmuster wird auf den Bytes geprüft, bevor
+                    dekodiert wird; stderr-Zeilen werden erst beim Flush
+                    gesammelt dekodiert.
+                    """
+                    nonlocal last_progress_pct
+                    if stream_name == "stdout":
+                        stdout_tail.append(raw_line)
+                        # Debug-Ausgabe im Terminal anzeigen (nur auf Wunsch;
+                        # dekodiert wird hier nur, wenn die Zeile auch
+                        # irgendwo ankommt)
+                        if _DEBUG_PRINT or logger.isEnabledFor(logging.DEBUG):
+                            line = raw_line.decode("utf-8", "replace").rstrip()
+                            if _DEBUG_PRINT:
+                                print(f"[WHISPER PROGRESS] {line}")
+                            logger.debug("Whisper stdout: %s", line)
+
+                        # Terminal output als Bytes puffern; Versand gebuendelt
+                        # im select-Zyklus (max. alle 100 ms / 32 Zeilen),
+                        # dekodiert wird einmal pro Flush statt pro Zeile
+                        pending_lines.append(b"[WHISPER PROGRESS] " + raw_line.rstrip())
+
+                        # Fortschritt erkennen; nur Aenderungen publizieren
+                        match = _PROGRESS_RE.search(raw_line)
+                        if match:
+                            progress = int(match.group(1))
+                            if progress != last_progress_pct:
+                                last_progress_pct = progress
+                                # Terminal-Ausgabe für Progress
+                                if _DEBUG_PRINT:
+                                    print(f"[PROGRESS UPDATE] Transkription bei {progress}%")
+                                # Fortschrittsereignis veröffentlichen (koalesziert)
+                                publish_coalesced(EventType.PROGRESS_UPDATE, {
+                                    **progress_base,
+                                    'progress': progress,
+                                    'status': f'Transkribiere... {progress}%',
+                                    'terminal_output': f"[PROGRESS UPDATE] Transkription bei {progress}%"
+                                })
+                    else:
+                        # stderr-Zeilen als Bytes sammeln, Dekodierung nur bei
+                        # aktivem DEBUG-Logging
+                        stderr.append(raw_line)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Whisper stderr: %s", raw_line.decode('utf-8', 'replace').rstrip())
+
+                # Beide Pipes nicht-blockierend im selben Thread lesen; das
+                # erspart zwei Reader-Threads samt Queue und das 100-ms-Polling
+                os.set_blocking(process.stdout.fileno(), False)
+                os.set_blocking(process.stderr.fileno(), False)
+
+                sel = selectors.DefaultSelector()
+                sel.register(process.stdout, selectors.EVENT_READ, "stdout")
+                sel.register(process.stderr, selectors.EVENT_READ, "stderr")
+                buffers = {"stdout": b"", "stderr": b""}
+                open_streams = 2
+
+                # Timeout-Konfiguration (Standard: 3600 Sekunden = 1 Stunde)
+                process_timeout = 3600
+                process_start_time = time.time()
+
+                while open_streams:
+                    # Check für Timeout (einmal pro select-Zyklus)
+                    elapsed_time = time.time() - process_start_time
+                    if elapsed_time > process_timeout:
+                        logger.error(f"Subprocess timeout after {process_timeout} seconds. Terminating process.")
+                        process.terminate()
+                        try:
+                            process.wait(timeout=5)
+                        except subprocess.TimeoutExpired:
+                            logger.error("Process didn't terminate gracefully, killing it.")
+                            process.kill()
+                            process.wait()
+
+                        # Cleanup temporäre Dateien auch bei Timeout
+                        try:
+                            cleanup_after_transcription(audio_path, config)
+                            logger.info(f"Cleaned up temp files after timeout: {audio_path}")
+                        except Exception as e:
+                            logger.warning(f"Failed to cleanup after timeout: {e}")
+
+                        raise TimeoutError(f"Transcription timed out after {process_timeout} seconds")
+
+                    events = sel.select(timeout=1.0)
+                    for key, _ in events:
+                        stream_name = key.data
+                        try:
+                            data = os.read(key.fd, 65536)
+                        except BlockingIOError:
+                            continue
 
-                try:
-                    # Queue mit Timeout lesen (verhindert ewiges Warten)
-                    stream_name, line = output_queue.get(timeout=0.1)
+                        if not data:
+                            # EOF auf diesem Stream
+                            sel.unregister(key.fileobj)
+                            key.fileobj.close()
+                            open_streams -= 1
+                            logger.debug(f"{stream_name} stream closed")
+                            continue
 
-                    if line is None:
-                        # Stream ist fertig
-                        streams_done[stream_name] = True
-                        logger.debug(f"{stream_name} stream closed")
-                        continue
+                        buffers[stream_name] += data
+                        *lines, buffers[stream_name] = buffers[stream_name].split(b"\n")
+                        for raw_line in lines:
+                            _handle_line(stream_name, raw_line + b"\n")
 
-                    # Verarbeite die Zeile je nach Stream
-                    if stream_name == "stdout":
-                        stdout.append(line)
-                        # Debug-Ausgabe im Terminal anzeigen
-                        terminal_msg = f"[WHISPER PROGRESS] {line.strip()}"
-                        print(terminal_msg, flush=True)
-                        logger.debug(f"Whisper stdout: {line.strip()}")
-
-                        # Terminal output über WebSocket senden
-                        publish(EventType.PROGRESS_UPDATE, {
-                            'task': 'transcription',
-                            'terminal_output': terminal_msg,
-                            'user_id': transcription_id
-                        })
+                    # Gebuendelten Terminal-Output verschicken
+                    if len(pending_lines) >= 32 or time.monotonic() - last_flush > 0.1:
+                        _flush_terminal()
 
-                        # Fortschritt erkennen und Event veröffentlichen
-                        match = progress_pattern.search(line)
-                        if match:
-                            progress = int(match.group(2))
-                            # Terminal-Ausgabe für Progress
-                            print(f"[PROGRESS UPDATE] Transkription bei {progress}%", flush=True)
-                            # Fortschrittsereignis veröffentlichen
-                            publish(EventType.PROGRESS_UPDATE, {
-                                'task': 'transcription',
-                                'progress': progress,
-                                'status': f'Transkribiere... {progress}%',
-                                'terminal_output': f"[PROGRESS UPDATE] Transkription bei {progress}%",
-                                'audio_path': audio_path,
-                                'user_id': transcription_id  # ID zur Identifizierung des Clients
-                            })
+                sel.close()
 
-                    elif stream_name == "stderr":
-                        stderr.append(line)
-                        logger.debug(f"Whisper stderr: {line.strip()}")
+                # Restinhalt ohne abschließenden Zeilenumbruch verarbeiten
+                for stream_name, rest in buffers.items():
+                    if rest:
+                        _handle_line(stream_name, rest)
+                _flush_terminal()
 
-                except queue.Empty:
-                    # Keine Daten verfügbar - prüfe ob Prozess noch läuft
-                    if process.poll() is not None:
-                        # Prozess ist fertig, aber warte noch auf Threads
-                        if stdout_thread.is_alive() or stderr_thread.is_alive():
-                            continue
-                        else:
-                            break
-                    continue
+                process.wait()
+                with _active_processes_lock:
+                    _active_processes.pop(transcription_id, None)
 
-            # Warte auf Threads (sollten bereits fertig sein)
-            stdout_thread.join(timeout=1)
-            stderr_thread.join(timeout=1)
+                # Ergebnis zusammensetzen
+                returncode = process.returncode
+                stdout_text = b''.join(stdout_tail).decode("utf-8", "replace")
+                stderr_text = b''.join(stderr).decode("utf-8", "replace")
             
-            # Ergebnis zusammensetzen
-            returncode = process.returncode
-            stdout_text = ''.join(stdout)
-            stderr_text = ''.join(stderr)
-            
-            # Debug: Liste der Dateien im temporären Verzeichnis nach dem Befehl
+            # Debug: Liste der Dateien im temporären Verzeichnis nach dem
+            # Befehl (scandir liefert die Pfade ohne Extra-Stat pro Datei)
             logger.info(f"Files in {temp_dir} after command:")
             try:
-                for file in os.listdir(temp_dir):
-                    logger.info(f"Found file: {os.path.join(temp_dir, file)}")
+                with os.scandir(temp_dir) as it:
+                    for entry in it:
+                        logger.info(f"Found file: {entry.path}")
             except Exception as e:
                 logger.error(f"Error listing files in {temp_dir}: {e}")
             
@@ -844,25 +1387,21 @@ def transcribe_audio(
             # Abschluss-Fortschritt senden
             if returncode == 0:
                 publish(EventType.PROGRESS_UPDATE, {
-                    'task': 'transcription',
+                    **progress_base,
                     'progress': 95,
                     'status': 'Verarbeite Transkriptionsergebnis...',
-                    'audio_path': audio_path,
-                    'user_id': transcription_id,
                     'phase': 'post_processing'
                 })
             else:
                 publish(EventType.PROGRESS_UPDATE, {
-                    'task': 'transcription',
+                    **progress_base,
                     'progress': 0,
                     'status': 'Transkription fehlgeschlagen',
-                    'audio_path': audio_path,
-                    'user_id': transcription_id,
                     'phase': 'failed'
                 })
             
             if returncode != 0:
-                error_msg = f"Whisper.cpp failed with return code {returncode}: {stderr}"
+                error_msg = f"Whisper.cpp failed with return code {returncode}: {stderr_text}"
                 logger.error(error_msg)
                 publish(EventType.TRANSCRIPTION_FAILED, {
                     "audio_path": audio_path,
@@ -876,64 +1415,82 @@ def transcribe_audio(
                 except Exception as e:
                     logger.warning(f"Failed to cleanup after error: {e}")
 
-                return TranscriptionResult(success=False, error=error_msg, stderr=stderr)
+                return TranscriptionResult(success=False, error=error_msg, stderr=stderr_text)
             
-            # Read output text
-            txt_output = os.path.join(temp_dir, "output.txt")
-            if not os.path.exists(txt_output):
-                error_msg = f"Output file not found: {txt_output}"
-                logger.error(error_msg)
-                publish(EventType.TRANSCRIPTION_FAILED, {
-                    "audio_path": audio_path,
-                    "error": error_msg
-                })
-                return TranscriptionResult(success=False, error=error_msg)
-            
-            with open(txt_output, "r", encoding="utf-8") as f:
-                text = f.read()
-            
-            # Convert to requested format
+            # Transkript aus dem JSON-Output lesen (Segmente + Text in
+            # einem Durchgang, keine otxt/osrt-Dateien mehr noetig)
+            parsed = _load_whisper_json(temp_dir)
+            if parsed is None:
+                # Fallback: aeltere Binaries ohne -oj schreiben output.txt
+                text = parse_whisper_output(temp_dir, ["txt"]).get("text")
+                segments = None
+                if text is None:
+                    error_msg = f"Output file not found: {os.path.join(temp_dir, 'output.json')}"
+                    logger.error(error_msg)
+                    publish(EventType.TRANSCRIPTION_FAILED, {
+                        "audio_path": audio_path,
+                        "error": error_msg
+                    })
+                    return TranscriptionResult(success=False, error=error_msg)
+            else:
+                text, segments = parsed
+
+            # Convert to requested format — nur die angeforderte Datei
+            # wird geschrieben
             if output_format == OutputFormat.TXT:
-                # Copy the txt file to output path
-                shutil.copy(txt_output, output_path)
+                # Einmal kodieren, ein Syscall — ohne TextIOWrapper-Puffer
+                with open(output_path, "wb", buffering=0) as f:
+                    f.write(text.encode("utf-8"))
             elif output_format == OutputFormat.SRT:
-                logger.info("Processing SRT output format (immer eigene Generierung mit segments_to_srt).")
-                json_output = parse_whisper_output(temp_dir, ["json"]).get("json")
-                if json_output and isinstance(json_output, dict) and "segments" in json_output:
-                    srt_content = segments_to_srt(json_output["segments"], max_chars=srt_max_chars, max_duration=srt_max_duration, linebreaks=srt_linebreaks)
-                    
+                srt_content = None
+                native_srt_file = os.path.join(temp_dir, "output.srt")
+                if native_srt and not daemon_used and os.path.exists(native_srt_file):
+                    # whisper.cpp hat das SRT schon geschrieben; JSON-Parse und
+                    # Segment-Iteration entfallen, die Datei wird nur kopiert
+                    shutil.copyfile(native_srt_file, output_path)
+                    logger.info(f"Natives whisper.cpp-SRT uebernommen: {output_path}")
+                    if segments:
+                        # JSON-Kontroll-Export wie beim Python-Pfad erzeugen
+                        try:
+                            from .output_formatter import export_json_control
+                            json_control_path = export_json_control(segments, output_path)
+                            logger.info(f"JSON-Kontroll-Export erstellt: {json_control_path}")
+                        except Exception as e:
+                            logger.warning(f"Fehler beim Erstellen des JSON-Kontroll-Exports: {str(e)}")
+                elif segments:
+                    srt_content = segments_to_srt(segments, max_chars=srt_max_chars, max_duration=srt_max_duration, linebreaks=srt_linebreaks)
+
                     # JSON-Kontroll-Export erzeugen (bei jeder SRT-Transkription)
                     try:
                         from .output_formatter import export_json_control
-                        json_control_path = export_json_control(json_output["segments"], output_path)
+                        json_control_path = export_json_control(segments, output_path)
                         logger.info(f"JSON-Kontroll-Export erstellt: {json_control_path}")
                     except Exception as e:
                         logger.warning(f"Fehler beim Erstellen des JSON-Kontroll-Exports: {str(e)}")
                 else:
                     srt_content = text_to_srt(text, max_chars=srt_max_chars, max_duration=srt_max_duration, linebreaks=srt_linebreaks)
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(srt_content)
-                logger.info(f"SRT wurde immer mit segments_to_srt erzeugt (max_chars={srt_max_chars}, max_duration={srt_max_duration}, linebreaks={srt_linebreaks}) und gespeichert unter: {output_path}")
+                if srt_content is not None:
+                    with open(output_path, "wb", buffering=0) as f:
+                        f.write(srt_content.encode("utf-8"))
+                    logger.info(f"SRT mit segments_to_srt erzeugt (max_chars={srt_max_chars}, max_duration={srt_max_duration}, linebreaks={srt_linebreaks}) und gespeichert unter: {output_path}")
             elif output_format == OutputFormat.VTT:
                 # Convert txt to VTT (simplified)
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write("WEBVTT\n\n00:00:00.000 --> 00:05:00.000\n" + text + "\n\n")
+                vtt_content = "WEBVTT\n\n00:00:00.000 --> 00:05:00.000\n" + text + "\n\n"
+                with open(output_path, "wb", buffering=0) as f:
+                    f.write(vtt_content.encode("utf-8"))
             elif output_format == OutputFormat.JSON:
-                # Create a simple JSON structure
                 json_data = {
                     "text": text,
-                    "segments": [{"text": text, "start": 0, "end": 300}]
+                    "segments": segments if segments else [{"text": text, "start": 0, "end": 300}]
                 }
-                with open(output_path, "w", encoding="utf-8") as f:
-                    json.dump(json_data, f, indent=2)
+                with open(output_path, "wb", buffering=0) as f:
+                    f.write(_json_dumps_bytes(json_data))
             
             # Send final progress update
             publish(EventType.PROGRESS_UPDATE, {
-                'task': 'transcription',
+                **progress_base,
                 'progress': 100,
                 'status': 'Transkription abgeschlossen',
-                'audio_path': audio_path,
-                'user_id': transcription_id,
                 'phase': 'completed'
             })
             
@@ -1022,9 +1579,10 @@ def transcribe_audio_chunked(
     chunker = AudioChunker(config)
     
     # Generate transcription ID for tracking
-    import uuid
     transcription_id = str(uuid.uuid4())[:8]
-    
+
+    chunk_temp_root = None
+
     try:
         # Split audio into chunks
         logger.info(f"Splitting large audio file into chunks...")
@@ -1069,28 +1627,37 @@ def transcribe_audio_chunked(
             "user_id": transcription_id
         })
         
-        # Transcribe each chunk
-        chunk_transcriptions = []
-        all_segments = []
-        
-        for i, chunk_info in enumerate(chunks):
-            chunk_num = i + 1
+        # Chunks parallel transkribieren: die Segmente sind unabhaengig,
+        # also duerfen mehrere whisper.cpp-Prozesse gleichzeitig laufen.
+        # Worker-Zahl wird durch Konfiguration und verfuegbaren RAM
+        # begrenzt (jede Modellinstanz belegt mehrere GB).
+        chunk_config = config.copy()
+        chunk_config["chunking"] = {**config.get("chunking", {}), "enabled": False}
+
+        # Ein gemeinsames Eltern-Temp-Verzeichnis mit einem Unterordner pro
+        # Chunk: ohne Isolation schreiben die parallelen whisper.cpp-Laeufe
+        # alle in dieselben output.*-Dateien im konfigurierten Temp-Ordner.
+        # Ein einziges rmtree am Ende raeumt alle Zwischendateien auf.
+        temp_parent = config.get("output", {}).get("temp_directory")
+        if temp_parent:
+            ensure_directory_exists(temp_parent)
+        chunk_temp_root = tempfile.mkdtemp(prefix="whisper_chunks_", dir=temp_parent)
+
+        ram_per_instance = MODEL_SIZES.get(model.value, {"ram": 3000})["ram"]
+        try:
+            ram_limited = max(1, int(_available_ram_mb() // ram_per_instance))
+        except Exception:
+            ram_limited = 1
+        max_workers = max(1, min(
+            config.get("chunking", {}).get("parallel_workers", 2),
+            ram_limited,
+            len(chunks)
+        ))
+        logger.info(f"Transcribing {len(chunks)} chunks with {max_workers} parallel worker(s)")
+
+        def _transcribe_chunk(index, chunk_info):
+            chunk_num = index + 1
             logger.info(f"Processing chunk {chunk_num}/{len(chunks)}: {chunk_info['filename']}")
-            
-            # Calculate overall progress for chunks
-            base_progress = (i / len(chunks)) * 90  # 0-90% for chunks, 90-100% for merging
-            
-            # Status update for current chunk
-            publish(EventType.PROGRESS_UPDATE, {
-                'task': 'transcription',
-                'status': f'Verarbeite Segment {chunk_num}/{len(chunks)}...',
-                'progress': base_progress,
-                'user_id': transcription_id,
-                'phase': 'chunk_processing',
-                'chunk_current': chunk_num,
-                'chunk_total': len(chunks)
-            })
-            
             publish(EventType.CUSTOM, {
                 "type": "CHUNK_STARTED",
                 "chunk": chunk_num,
@@ -1098,46 +1665,72 @@ def transcribe_audio_chunked(
                 "filename": chunk_info['filename'],
                 "user_id": transcription_id
             })
-            
             # Transcribe chunk (recursive call without chunking)
-            chunk_config = config.copy()
-            chunk_config["chunking"]["enabled"] = False  # Disable chunking for individual chunks
-            
-            chunk_result = transcribe_audio(
+            return transcribe_audio(
                 audio_path=chunk_info['path'],
                 output_format=OutputFormat.JSON,  # Get JSON for segment timing
                 language=language,
                 model=model,
-                config=chunk_config
+                config=chunk_config,
+                temp_dir=os.path.join(chunk_temp_root, f"chunk_{index}")
             )
-            
-            if not chunk_result.success:
-                logger.error(f"Failed to transcribe chunk {chunk_num}: {chunk_result.error}")
+
+        chunk_results: Dict[int, TranscriptionResult] = {}
+        completed = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_transcribe_chunk, i, chunk_info): i
+                for i, chunk_info in enumerate(chunks)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                chunk_num = i + 1
+                chunk_results[i] = future.result()
+                completed += 1
+
+                # Fortschritt nach Fertigstellungsgrad (0-90 %; Rest Merge)
+                publish(EventType.PROGRESS_UPDATE, {
+                    'task': 'transcription',
+                    'status': f'Segment {completed}/{len(chunks)} fertig...',
+                    'progress': (completed / len(chunks)) * 90,
+                    'user_id': transcription_id,
+                    'phase': 'chunk_processing',
+                    'chunk_current': completed,
+                    'chunk_total': len(chunks)
+                })
+
+        # Ergebnisse in Original-Reihenfolge zusammensetzen
+        chunk_transcriptions = []
+        all_segments = []
+        for i, chunk_info in enumerate(chunks):
+            chunk_num = i + 1
+            chunk_result = chunk_results.get(i)
+            if chunk_result is None or not chunk_result.success:
+                error = chunk_result.error if chunk_result else "unbekannter Fehler"
+                logger.error(f"Failed to transcribe chunk {chunk_num}: {error}")
                 publish(EventType.CUSTOM, {
                     "type": "CHUNK_FAILED",
                     "chunk": chunk_num,
-                    "error": chunk_result.error
+                    "error": error
                 })
                 # Continue with other chunks even if one fails
                 continue
-            
-            # Adjust timestamps for chunk position
+
+            # Adjust timestamps for chunk position; die Segmente gehoeren
+            # nach dem Pool-Join exklusiv uns, also entfaellt das .copy()
             chunk_start_time = chunk_info['start_time']
             if chunk_result.segments:
-                adjusted_segments = []
-                for segment in chunk_result.segments:
-                    adjusted_segment = segment.copy()
-                    adjusted_segment['start'] = segment.get('start', 0) + chunk_start_time
-                    adjusted_segment['end'] = segment.get('end', 0) + chunk_start_time
-                    adjusted_segments.append(adjusted_segment)
-                all_segments.extend(adjusted_segments)
-            
+                for seg in chunk_result.segments:
+                    seg['start'] = seg.get('start', 0) + chunk_start_time
+                    seg['end'] = seg.get('end', 0) + chunk_start_time
+                all_segments.extend(chunk_result.segments)
+
             chunk_transcriptions.append({
                 "chunk": chunk_num,
                 "text": chunk_result.text,
                 "start_time": chunk_start_time
             })
-            
+
             publish(EventType.CUSTOM, {
                 "type": "CHUNK_COMPLETED",
                 "chunk": chunk_num,
@@ -1161,8 +1754,8 @@ def transcribe_audio_chunked(
         
         # Save output in requested format
         if output_format == OutputFormat.TXT:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(merged_text)
+            with open(output_path, "wb", buffering=0) as f:
+                f.write(merged_text.encode("utf-8"))
         elif output_format == OutputFormat.SRT:
             if all_segments:
                 srt_content = segments_to_srt(all_segments, max_chars=srt_max_chars, 
@@ -1170,25 +1763,28 @@ def transcribe_audio_chunked(
             else:
                 srt_content = text_to_srt(merged_text, max_chars=srt_max_chars, 
                                         max_duration=srt_max_duration, linebreaks=srt_linebreaks)
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(srt_content)
+            with open(output_path, "wb", buffering=0) as f:
+                f.write(srt_content.encode("utf-8"))
         elif output_format == OutputFormat.VTT:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write("WEBVTT\n\n00:00:00.000 --> 00:05:00.000\n" + merged_text + "\n\n")
+            vtt_content = "WEBVTT\n\n00:00:00.000 --> 00:05:00.000\n" + merged_text + "\n\n"
+            with open(output_path, "wb", buffering=0) as f:
+                f.write(vtt_content.encode("utf-8"))
         elif output_format == OutputFormat.JSON:
             output_data = {
                 "text": merged_text,
                 "segments": all_segments,
                 "chunks": len(chunks)
             }
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(output_data, f, ensure_ascii=False, indent=2)
+            with open(output_path, "wb", buffering=0) as f:
+                f.write(_json_dumps_bytes(output_data))
         
         # Clean up chunks
         chunk_dir = os.path.dirname(chunks[0]['path']) if chunks else None
         if chunk_dir:
             chunker.cleanup_chunks(chunk_dir)
-        
+        shutil.rmtree(chunk_temp_root, ignore_errors=True)
+        chunk_temp_root = None
+
         logger.info(f"Successfully transcribed {len(chunks)} chunks")
         
         publish(EventType.TRANSCRIPTION_COMPLETED, {
@@ -1200,7 +1796,6 @@ def transcribe_audio_chunked(
         
         # Clean up audio file and chunks after successful transcription
         try:
-            config = load_config()
             cleanup_after_transcription(audio_path, config)
             logger.info(f"Cleaned up audio file and chunks: {audio_path}")
         except Exception as e:
@@ -1218,6 +1813,8 @@ def transcribe_audio_chunked(
     except Exception as e:
         error_msg = f"Error in chunked transcription: {str(e)}"
         logger.error(error_msg)
+        if chunk_temp_root:
+            shutil.rmtree(chunk_temp_root, ignore_errors=True)
         publish(EventType.TRANSCRIPTION_FAILED, {
             "audio_path": audio_path,
             "error": error_msg
@@ -16,7 +16,7 @@ from ..core.events import EventType, publish
 from ..core.exceptions import ModelError
 from ..core.logging_setup import get_logger
 from ..core.models import WhisperModel
-from ..core.utils import ensure_directory_exists
+from ..core.utils import ensure_directory_exists, fast_move
 
 logger = get_logger(__name__)
 
@@ -154,28 +154,48 @@ def download_model(model_name: str, config: Optional[Dict] = None, force: bool =
         with requests.get(model_url, stream=True) as r:
             r.raise_for_status()
             total_size = int(r.headers.get('content-length', 0))
-            
+
             # Create a temporary file for downloading
             temp_path = model_path + ".download"
-            
-            with open(temp_path, 'wb') as f:
+
+            # Large 1 MiB reads from the raw stream and direct os.write
+            # keep the syscall count ~128x lower than 8 KiB chunks
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                if total_size > 0 and hasattr(os, "posix_fallocate"):
+                    try:
+                        os.posix_fallocate(fd, 0, total_size)
+                    except OSError:
+                        pass
+
+                last_pct = -1
                 with tqdm(total=total_size, unit='B', unit_scale=True, desc=f"Downloading {model_name}") as pbar:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            pbar.update(len(chunk))
-                            
-                            # Report progress
-                            if total_size > 0:
-                                progress = (pbar.n / total_size) * 100
+                    while True:
+                        chunk = r.raw.read(1 << 20, decode_content=True)
+                        if not chunk:
+                            break
+                        os.write(fd, chunk)
+                        pbar.update(len(chunk))
+
+                        # Report progress in >=0.5% steps to keep the
+                        # event bus quiet
+                        if total_size > 0:
+                            progress = (pbar.n / total_size) * 100
+                            pct = int(progress * 2)
+                            if pct != last_pct:
+                                last_pct = pct
                                 publish(EventType.PROGRESS_UPDATE, {
                                     "task": "model_download",
                                     "progress": progress,
                                     "model": model_name
                                 })
-            
+            finally:
+                os.close(fd)
+
             # Move the temporary file to the final location
-            shutil.move(temp_path, model_path)
+            fast_move(temp_path, model_path)
         
         logger.info(f"Model {model_name} downloaded to {model_path}")
         publish(EventType.MODEL_DOWNLOAD_COMPLETED, {"model": model_name, "path": model_path})
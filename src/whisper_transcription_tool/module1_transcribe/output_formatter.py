@@ -634,11 +634,34 @@ def export_json_control(transcript_data: List[Dict], output_path: str) -> str:
     Returns:
         Pfad zur erstellten JSON-Datei
     """
+    import hashlib
     import os
     import json
     import srt
     from datetime import timedelta
-    
+
+    # Zielpfad und Segment-Hash vorab bestimmen: ist die Kontrolldatei
+    # fuer identische Segmente bereits vorhanden, entfaellt die gesamte
+    # Re-Segmentierung und Serialisierung
+    output_dir = os.path.dirname(output_path)
+    json_exporter_dir = os.path.join(output_dir, "JSON-Exporter")
+    base_name, _ = os.path.splitext(os.path.basename(output_path))
+    json_filepath = os.path.join(json_exporter_dir, f"{base_name}.json")
+    hash_filepath = json_filepath + ".hash"
+
+    segments_hash = hashlib.blake2b(
+        json.dumps(transcript_data, sort_keys=True).encode("utf-8"),
+        digest_size=16
+    ).hexdigest()
+    try:
+        if os.path.exists(json_filepath):
+            with open(hash_filepath, "r", encoding="utf-8") as f:
+                if f.read().strip() == segments_hash:
+                    logger.info(f"JSON-Kontrolldatei unveraendert, ueberspringe Export: {json_filepath}")
+                    return json_filepath
+    except OSError:
+        pass
+
     # Die gleiche Segmentierungslogik wie bei segments_to_srt anwenden
     # Standardwerte für max_chars und max_duration
     max_chars = 20  # Gleicher Wert wie in segments_to_srt
@@ -761,21 +784,14 @@ def export_json_control(transcript_data: List[Dict], output_path: str) -> str:
         json_segments.append(json_segment)
     
     # JSON-Exporter-Verzeichnis erstellen, falls nicht vorhanden
-    output_dir = os.path.dirname(output_path)
-    json_exporter_dir = os.path.join(output_dir, "JSON-Exporter")
-    
     os.makedirs(json_exporter_dir, exist_ok=True)
     logger.info(f"JSON-Exporter-Verzeichnis: {json_exporter_dir}")
-    
-    # Ausgabedateiname erstellen (gleicher Name wie Audiodatei, aber mit .json-Endung)
-    base_filename = os.path.basename(output_path)
-    base_name, _ = os.path.splitext(base_filename)
-    json_filename = f"{base_name}.json"
-    json_filepath = os.path.join(json_exporter_dir, json_filename)
-    
-    # Daten als JSON speichern
+
+    # Daten als JSON speichern, Hash-Sidecar fuer den Skip-Pfad daneben
     with open(json_filepath, 'w', encoding='utf-8') as json_file:
         json.dump(json_segments, json_file, ensure_ascii=False, indent=2)
+    with open(hash_filepath, 'w', encoding='utf-8') as f:
+        f.write(segments_hash)
     
     logger.info(f"JSON-Kontrolldatei mit {len(json_segments)} Segmenten gespeichert: {json_filepath}")
     return json_filepath
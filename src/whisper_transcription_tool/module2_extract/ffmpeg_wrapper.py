@@ -296,6 +296,42 @@ def convert_opus_to_mp3(
     return run_command(cmd)
 
 
+def convert_opus_to_wav(
+    ffmpeg_path: str,
+    opus_path: str,
+    output_path: str
+) -> Tuple[int, str, str]:
+    """
+    Convert Opus audio file to 16 kHz mono WAV.
+
+    Whisper resamples internally anyway, so a plain PCM extraction is
+    cheaper than an MP3 re-encode.
+
+    Args:
+        ffmpeg_path: Path to FFmpeg binary
+        opus_path: Path to Opus file
+        output_path: Path to save WAV file
+
+    Returns:
+        Tuple of (return_code, stdout, stderr)
+    """
+    # Prepare command
+    cmd = [
+        ffmpeg_path,
+        "-i", opus_path,
+        "-vn",
+        "-acodec", "pcm_s16le",
+        "-ar", "16000",
+        "-ac", "1",
+        "-y",                  # Overwrite output file
+        output_path
+    ]
+
+    # Run FFmpeg
+    logger.debug(f"Converting Opus to WAV: {' '.join(cmd)}")
+    return run_command(cmd)
+
+
 def check_ffmpeg_capabilities(ffmpeg_path: str) -> Dict[str, bool]:
     """
     Check FFmpeg capabilities.
@@ -6,12 +6,31 @@ import logging
 import os
 import json  # Für WebSocket-Kommunikation
 import asyncio  # Für WebSocket-Kommunikation
-import difflib  # Für Textvergleich
-import re  # Für SRT-Parsing
+import bisect  # Für die RAM-Schwellen der Korrekturstufen
+import platform
+import psutil  # Für Systeminfos im Korrektur-Status
+import re  # Für Quantisierungs-Erkennung in Modellnamen
+import stat as stat_module  # Für Dateityp-Prüfung ohne doppelten stat-Syscall
+import string  # Für Laufwerksbuchstaben unter Windows
+import time  # Für TTL-Cache der Modellsuche
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
+try:
+    import orjson
+except ImportError:  # orjson ist optional; Fallback auf das stdlib-json
+    orjson = None
+
+try:
+    # libuv-basierter Event-Loop: deutlich geringerer Overhead pro await,
+    # was vor allem den WebSocket-Broadcastpfad beschleunigt
+    import uvloop
+    uvloop.install()
+except ImportError:  # uvloop ist optional (und nur auf Unix verfügbar)
+    uvloop = None
+
 import uvicorn
 from fastapi import FastAPI, File, Form, Request, UploadFile, WebSocket, WebSocketDisconnect, BackgroundTasks, HTTPException
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, FileResponse
@@ -21,22 +40,51 @@ from pydantic import BaseModel, Field
 
 from ..core.config import load_config, save_config
 from ..core.constants import VERSION
-from ..core.model_manager import get_downloaded_models
+from ..core.file_manager import FileManager
+from ..core.model_manager import (
+    download_model,
+    get_downloaded_models,
+    get_model_info,
+    get_recommended_models,
+)
 from ..core.models import OutputFormat, WhisperModel
 from ..core.logging_setup import get_logger
-from ..core.events import EventType, Event, subscribe, unsubscribe
+from ..core.events import EventType, Event, set_event_loop, subscribe, unsubscribe
 from ..core.utils import ensure_directory_exists
+# Modul-Referenzen statt direkter Namen: die Integrationstests patchen
+# module1_transcribe.transcribe_audio bzw. die module5-Funktionen am Modul;
+# Attribut-Zugriff zur Aufrufzeit lässt die Patches greifen, spart aber
+# trotzdem den Import pro Request
+from .. import module1_transcribe, module5_text_correction
+from ..module1_transcribe import list_models
+from ..module2_extract import extract_audio
 
 # Phone recording module
 from .phone_routes import router as phone_router
+from .compare_utils import compare_segments, parse_srt_file
 
 logger = get_logger(__name__)
 
-# Pydantic models for request/response bodies if needed
-from pydantic import BaseModel, Field
+# Create FastAPI app; mit orjson serialisieren Endpunkte, die Dicts
+# zurueckgeben (z. B. grosse Transkriptions-Resultate), in C statt im
+# pure-Python-json
+if orjson is not None:
+    from fastapi.responses import ORJSONResponse
+    app = FastAPI(title="Whisper Transcription Tool", default_response_class=ORJSONResponse)
+else:
+    app = FastAPI(title="Whisper Transcription Tool")
 
-# Create FastAPI app
-app = FastAPI(title="Whisper Transcription Tool")
+
+def _event_json(data) -> bytes:
+    """Serialisiere Event-Daten für den WebSocket-Versand (orjson wenn verfügbar).
+
+    Liefert Bytes: derselbe Puffer wird per send_bytes an alle Clients
+    gereicht, statt den Text-Frame-Pfad pro Verbindung neu kodieren zu
+    lassen. Die Frontends dekodieren Binär-Frames selbst.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
 
 
 def format_duration(seconds: Optional[float]) -> Optional[str]:
@@ -57,12 +105,17 @@ def format_duration(seconds: Optional[float]) -> Optional[str]:
     if seconds < 60:
         return f"{seconds:.2f} s"
 
-    minutes, rem_seconds = divmod(seconds, 60)
-    if minutes < 60:
-        return f"{int(minutes)}m {rem_seconds:.1f}s"
+    # Ganzzahlarithmetik statt divmod-Kette: keine Tupel-Allokationen
+    # auf dem Antwort-Pfad
+    total = int(seconds)
+    if seconds < 3600:
+        minutes = total // 60
+        return f"{minutes}m {seconds - 60 * minutes:.1f}s"
 
-    hours, rem_minutes = divmod(minutes, 60)
-    return f"{int(hours)}h {int(rem_minutes)}m {rem_seconds:.1f}s"
+    hours = total // 3600
+    rem = total - 3600 * hours
+    minutes = rem // 60
+    return f"{hours}h {minutes}m {seconds - 3600 * hours - 60 * minutes:.1f}s"
 
 # Phone API-Routes registrieren
 app.include_router(phone_router)
@@ -77,6 +130,72 @@ app.mount("/static", StaticFiles(directory=str(current_dir / "static")), name="s
 # Global configuration
 config = load_config()
 
+# CPU-Zähler einmalig anstoßen: danach liefert cpu_percent(interval=None)
+# den Durchschnitt seit dem letzten Aufruf, ohne den Worker zu blockieren
+psutil.cpu_percent(interval=None)
+
+# Plattform einmal beim Laden ermitteln; platform.system() kann je nach
+# Plattform einen Subprozess starten und aendert sich zur Laufzeit nie
+_PLATFORM = platform.system()
+
+# Der Modellkatalog ist statisch (ändert sich nur mit Releases); einmal
+# aufbauen statt pro Request — die Handler kopieren die Einträge flach,
+# bevor sie z. B. is_downloaded setzen
+_cached_recommended_models = lru_cache(maxsize=1)(get_recommended_models)
+
+# Gültige Modellnamen einmalig beim Modul-Import aufbauen; die Enum
+# ändert sich zur Laufzeit nicht
+_WHISPER_MODEL_VALUES = tuple(model.value for model in WhisperModel)
+_WHISPER_MODEL_VALUE_SET = frozenset(_WHISPER_MODEL_VALUES)
+
+# Statischer Teil des Transcribe-Template-Kontexts: die Enum-Listen und
+# die Version sind stabil, pro Request kommt nur Dynamisches dazu
+_TRANSCRIBE_CTX_STATIC = {
+    "models": _WHISPER_MODEL_VALUES,
+    "languages": ["auto", "en", "de", "fr", "es", "it", "ja", "zh", "nl", "pt", "ru"],
+    "output_formats": [format.value for format in OutputFormat],
+    "default_model": "large-v3-turbo",  # Setze large-v3-turbo als Standardmodell
+    "app_version": VERSION,
+}
+
+# Geteilte FileManager-Instanz für die Disk-Endpunkte; der Konstruktor
+# lädt die Konfiguration, das muss nicht pro Request passieren
+_FILE_MANAGER: Optional[FileManager] = None
+
+
+def _get_file_manager() -> FileManager:
+    """Liefert die geteilte FileManager-Instanz (lazy angelegt)."""
+    global _FILE_MANAGER
+    if _FILE_MANAGER is None:
+        _FILE_MANAGER = FileManager()
+    return _FILE_MANAGER
+
+
+def _invalidate_file_manager() -> None:
+    """Verwirft die Instanz, z. B. nach Änderungen an der Konfiguration."""
+    global _FILE_MANAGER
+    _FILE_MANAGER = None
+
+
+# Letzter Disk-Snapshot: der Hintergrund-Task und die HTTP-Endpunkte
+# teilen sich das Ergebnis von monitor_disk_space(), statt das Dateisystem
+# pro Request erneut abzufragen
+_DISK_SNAPSHOT: Dict = {}
+_DISK_SNAPSHOT_TS: float = 0.0
+_DISK_SNAPSHOT_MAX_AGE = 30.0  # Sekunden
+
+
+async def _get_disk_stats(max_age: float = _DISK_SNAPSHOT_MAX_AGE) -> Dict:
+    """Liefert Disk-Statistiken, höchstens max_age Sekunden alt."""
+    global _DISK_SNAPSHOT, _DISK_SNAPSHOT_TS
+    if _DISK_SNAPSHOT and time.monotonic() - _DISK_SNAPSHOT_TS < max_age:
+        return _DISK_SNAPSHOT
+    stats = await asyncio.to_thread(_get_file_manager().monitor_disk_space)
+    _DISK_SNAPSHOT = stats
+    _DISK_SNAPSHOT_TS = time.monotonic()
+    return stats
+
+
 # --- Pydantic Models ---
 class SetDirectoryPayload(BaseModel):
     directory: str = Field(..., description="The new directory path for storing models.")
@@ -84,57 +203,128 @@ class SetDirectoryPayload(BaseModel):
 # WebSocket-Verbindungen
 active_connections = {}
 
-# Set to store active WebSocket connections specifically for progress updates
-progress_websockets = set()  # Explizite Deklaration ohne Typ-Annotation
+# Pro Fortschritts-Verbindung eine eigene Queue mit Writer-Task: der
+# Event-Handler stellt Nachrichten nur per put_nowait ein, ein langsamer
+# Client staut sich ausschließlich in seiner eigenen Queue statt alle
+# anderen über den gemeinsamen Broadcast auszubremsen
+progress_queues: Dict[WebSocket, asyncio.Queue] = {}
+
+# Eingefrorener Snapshot der Client-Queues: wird nur bei Verbindungsauf-
+# und -abbau neu gebaut, damit der Broadcast-Pfad pro Event keine
+# O(N)-Listenkopie mehr anlegt (Zuweisung ist unter asyncio atomar)
+_queues_snapshot: Tuple[asyncio.Queue, ...] = ()
+
+
+def _register_progress_socket(websocket: WebSocket, queue: asyncio.Queue) -> None:
+    """Nimm eine Verbindung auf und aktualisiere den Queue-Snapshot."""
+    global _queues_snapshot
+    progress_queues[websocket] = queue
+    _queues_snapshot = tuple(progress_queues.values())
+
+
+def _unregister_progress_socket(websocket: WebSocket) -> None:
+    """Entferne eine Verbindung und aktualisiere den Queue-Snapshot."""
+    global _queues_snapshot
+    progress_queues.pop(websocket, None)
+    _queues_snapshot = tuple(progress_queues.values())
+
+# Letzter verschickter Frame als fertige Bytes: neue Clients bekommen ihn
+# per send_bytes erneut, ohne dass pro Event ein Dict kopiert oder beim
+# Reconnect neu serialisiert werden muss
+_last_progress_bytes: Optional[bytes] = None
+
+# Koaleszierte PROGRESS_UPDATE-Frames: pro (Task, Payload-Art) wird nur
+# der letzte Stand gehalten; ein Hintergrund-Task verschickt ihn mit
+# maximal 20 Hz. Damit kostet eine hohe Event-Frequenz nicht mehr einen
+# Broadcast pro Event. Die Payload-Art gehört zum Schlüssel, damit ein
+# Terminal-Output-Batch keinen anstehenden Prozent-Frame desselben Tasks
+# überschreibt (gleiche Schlüsselung wie im EventCoalescer des Kerns).
+_latest_progress: Dict[Tuple[str, bool], dict] = {}
+_progress_dirty: Optional[asyncio.Event] = None
+
+
+async def _progress_flusher() -> None:
+    """Verschickt koaleszierte Fortschritts-Frames mit maximal 20 Hz."""
+    while True:
+        await _progress_dirty.wait()
+        _progress_dirty.clear()
+        snapshot = list(_latest_progress.values())
+        _latest_progress.clear()
+        for data in snapshot:
+            _broadcast(_event_json(data))
+        await asyncio.sleep(0.05)
+
+
+def _broadcast(message: bytes) -> None:
+    """Stelle eine Nachricht in die Queues aller verbundenen Clients ein.
+
+    put_nowait blockiert den Event-Handler nie. Läuft die Queue eines
+    Clients voll, wird der älteste Eintrag verworfen und der neueste
+    eingestellt — für Fortschrittsanzeigen zählt nur der letzte Stand.
+    Der fertig serialisierte Frame wird zugleich für Replays an neue
+    Clients aufbewahrt.
+    """
+    global _last_progress_bytes
+    _last_progress_bytes = message
+    for queue in _queues_snapshot:
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                pass
+
+
+async def _ws_writer(websocket: WebSocket, queue: asyncio.Queue) -> None:
+    """Writer-Task eines Clients: sendet dessen Queue-Inhalt sequenziell."""
+    try:
+        while True:
+            message = await queue.get()
+            await websocket.send_bytes(message)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to send to WebSocket: {e}")
+        _unregister_progress_socket(websocket)
+        logger.info(f"Removed faulty websocket. Remaining: {len(progress_queues)}")
 
-# Debug-Variable zum Verfolgen der letzten gesendeten Fortschrittsdaten
-last_progress_data = None
 
 async def progress_event_handler(event: Event):
     """Handles progress events and sends them to relevant clients."""
-    global last_progress_data, progress_websockets
-
     try:
         if event.event_type == EventType.PROGRESS_UPDATE:
-            # Log the received event
-            status = event.data.get('status', '')
-            progress = event.data.get('progress', 0)
+            # Ohne aktive WebSockets sofort zurück — noch vor jedem
+            # dict-Zugriff und Log-Formatieren (heißester Pfad bei
+            # Headless-/CLI-Transkriptionen)
+            if not progress_queues:
+                return
+
             task = event.data.get('task', 'unknown')
 
-            logger.info(f"PROGRESS_HANDLER: {task} event - Status: {status}, Progress: {progress}%")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "PROGRESS_HANDLER: %s event - Status: %s, Progress: %s%% (%d websockets)",
+                    task, event.data.get('status', ''), event.data.get('progress', 0),
+                    len(progress_queues),
+                )
 
             # Don't require specific fields - just pass the event data through
             # The frontend will handle different event types appropriately
 
-            # Speichere die letzte Fortschrittsmeldung für neu verbundene Clients
-            last_progress_data = event.data.copy()
-
-            # Direkter Zugriff auf progress_websockets mit Kopie der Menge
-            current_sockets = list(progress_websockets)
-            socket_count = len(current_sockets)
-
-            # Überprüfe, ob es aktive WebSockets gibt
-            if socket_count == 0:
-                logger.warning("PROGRESS_HANDLER: No active websockets, skipping broadcast.")
-                return
-
-            logger.info(f"PROGRESS_HANDLER: Broadcasting to {socket_count} active websockets")
-
-            # Erstelle die Nachricht einmal für alle Clients
-            message = json.dumps(event.data)
-
-            # Sende an alle aktiven Verbindungen
-            for ws in current_sockets:
-                try:
-                    await ws.send_text(message)
-                    logger.debug(f"Successfully sent: {message[:100]}...")
-                except Exception as e:
-                    logger.error(f"Failed to send progress to WebSocket: {e}")
-                    try:
-                        progress_websockets.discard(ws)
-                        logger.info(f"Removed faulty websocket. Remaining: {len(progress_websockets)}")
-                    except Exception as e2:
-                        logger.error(f"Error removing websocket: {e2}")
+            # Nur den letzten Stand pro Task und Payload-Art merken; der
+            # Flusher-Task verschickt ihn gebündelt (max. 20 Hz). Veraltete
+            # Zwischenstände werden so gar nicht erst serialisiert.
+            _latest_progress[(task, "progress" in event.data)] = event.data
+            if _progress_dirty is not None:
+                _progress_dirty.set()
+            else:
+                # Flusher (noch) nicht gestartet — direkt verschicken
+                _broadcast(_event_json(event.data))
         elif event.event_type == EventType.CUSTOM:
             # Handle custom events including correction workflow events
             event_subtype = event.data.get('type', '')
@@ -143,22 +333,10 @@ async def progress_event_handler(event: Event):
             if event_subtype in ['correction_started', 'correction_completed', 'correction_error']:
                 logger.info(f"PROGRESS_HANDLER: Correction event - {event_subtype}")
 
-            # Store last event for new clients
-            last_progress_data = event.data.copy()
-
-            # Send to WebSocket clients
-            current_sockets = list(progress_websockets)
-            if current_sockets:
-                message = json.dumps(event.data)
-                for ws in current_sockets:
-                    try:
-                        await ws.send_text(message)
-                    except Exception as e:
-                        logger.error(f"Failed to send custom event to WebSocket: {e}")
-                        try:
-                            progress_websockets.discard(ws)
-                        except Exception:
-                            pass
+            # Send to WebSocket clients (der Frame selbst wird in
+            # _broadcast für neu verbundene Clients aufbewahrt)
+            if progress_queues:
+                _broadcast(_event_json(event.data))
         else:
             logger.warning(f"Received event with unexpected type: {event.event_type}")
 
@@ -173,36 +351,45 @@ subscribe(EventType.CUSTOM, progress_event_handler)
 
 @app.websocket("/ws/progress")
 async def progress_websocket(websocket: WebSocket):
-    global progress_websockets
-    
+    writer_task = None
+
     try:
         await websocket.accept()
         logger.info("New WebSocket connection accepted for progress updates")
-        
-        # Füge die Verbindung zur globalen Set hinzu
-        progress_websockets.add(websocket)
-        logger.info(f"Added WebSocket connection. Total: {len(progress_websockets)}")
-        
-        # Sende letzte Fortschrittsmeldung, falls vorhanden
-        if last_progress_data:
-            await websocket.send_json(last_progress_data)
+
+        # Eigene Queue samt Writer-Task für diese Verbindung anlegen
+        queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+        _register_progress_socket(websocket, queue)
+        writer_task = asyncio.create_task(_ws_writer(websocket, queue))
+        logger.info(f"Added WebSocket connection. Total: {len(progress_queues)}")
+
+        # Sende letzte Fortschrittsmeldung, falls vorhanden (bereits
+        # serialisierte Bytes, kein erneutes json.dumps pro Reconnect)
+        if _last_progress_bytes:
+            await websocket.send_bytes(_last_progress_bytes)
             logger.info("Sent last progress data to new connection")
         
-        # Warte auf Verbindungsabbau
+        # Warte auf Verbindungsabbau; websocket.receive() statt
+        # receive_text() spart die Wrapper-Schicht pro eingehender Nachricht
         while True:
-            data = await websocket.receive_text()
-            if data.lower() == "ping":
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            data = message.get("text")
+            if data and data.lower() == "ping":
                 await websocket.send_text("pong")
                 logger.debug("Received ping, sent pong")
-            
+
     except WebSocketDisconnect:
         logger.info("WebSocket disconnected")
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
     finally:
         try:
-            progress_websockets.discard(websocket)
-            logger.info(f"Removed WebSocket connection. Remaining: {len(progress_websockets)}")
+            if writer_task is not None:
+                writer_task.cancel()
+            _unregister_progress_socket(websocket)
+            logger.info(f"Removed WebSocket connection. Remaining: {len(progress_queues)}")
         except Exception as e:
             logger.error(f"Error removing WebSocket: {e}")
 
@@ -246,19 +433,25 @@ async def index(request: Request):
 async def transcribe_page(request: Request):
     """Render the transcription page."""
     return templates.TemplateResponse(
-        "transcribe.html", 
+        "transcribe.html",
         {
-            "request": request, 
-            "models": [model.value for model in WhisperModel],
-            "languages": ["auto", "en", "de", "fr", "es", "it", "ja", "zh", "nl", "pt", "ru"],
-            "output_formats": [format.value for format in OutputFormat],
+            **_TRANSCRIBE_CTX_STATIC,
+            "request": request,
             "default_output_dir": config["output"]["default_directory"],
-            "default_model": "large-v3-turbo",  # Setze large-v3-turbo als Standardmodell
-            "app_version": VERSION
         }
     )
 
 
+# Content-Types der Download-Endpunkte: O(1)-Lookup statt verketteter
+# endswith-Prüfungen mit wiederholtem lower()
+_CONTENT_TYPES = {
+    ".txt": "text/plain; charset=utf-8",
+    ".srt": "text/plain; charset=utf-8",
+    ".vtt": "text/vtt; charset=utf-8",
+    ".json": "application/json; charset=utf-8",
+}
+
+
 @app.get("/api/download")
 async def download_file(file: str):
     """
@@ -271,29 +464,32 @@ async def download_file(file: str):
         FileResponse with the file
     """
     try:
-        # Sicherheitscheck: Stelle sicher, dass die Datei im erlaubten Bereich liegt
-        if not os.path.exists(file) or not os.path.isfile(file):
+        # Sicherheitscheck: ein einzelner stat im Thread-Pool statt
+        # exists + isfile (zwei Syscalls) auf dem Event-Loop
+        try:
+            st = await asyncio.to_thread(os.stat, file)
+        except (FileNotFoundError, NotADirectoryError):
             logger.error(f"Download requested for non-existent file: {file}")
             return JSONResponse({"error": "Datei existiert nicht"}, status_code=404)
+        if not stat_module.S_ISREG(st.st_mode):
+            logger.error(f"Download requested for non-regular file: {file}")
+            return JSONResponse({"error": "Datei existiert nicht"}, status_code=404)
 
         # Bestimme den Content-Type basierend auf der Dateiendung
-        content_type = "application/octet-stream"
-        if file.lower().endswith('.txt'):
-            content_type = "text/plain; charset=utf-8"
-        elif file.lower().endswith('.srt'):
-            content_type = "text/plain; charset=utf-8"
-        elif file.lower().endswith('.vtt'):
-            content_type = "text/vtt; charset=utf-8"
-        elif file.lower().endswith('.json'):
-            content_type = "application/json; charset=utf-8"
+        content_type = _CONTENT_TYPES.get(
+            os.path.splitext(file)[1].lower(), "application/octet-stream"
+        )
 
         filename = os.path.basename(file)
         logger.info(f"Serving download for file: {filename}")
 
+        # stat_result weiterreichen, damit Starlette die Datei nicht ein
+        # zweites Mal stat-en muss
         return FileResponse(
             path=file,
             filename=filename,
             media_type=content_type,
+            stat_result=st,
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
     except Exception as e:
@@ -301,6 +497,21 @@ async def download_file(file: str):
         return JSONResponse({"error": f"Fehler beim Herunterladen: {str(e)}"}, status_code=500)
 
 
+def _scan_subdirectories(path: str) -> List[Dict[str, str]]:
+    """Liste Unterverzeichnisse mit os.scandir auf.
+
+    scandir liefert is_dir() direkt aus dem dirent — ein Syscall pro
+    Eintrag statt listdir plus isdir-stat für jeden Namen.
+    """
+    with os.scandir(path) as it:
+        entries = [
+            {"path": entry.path, "name": entry.name}
+            for entry in it if entry.is_dir()
+        ]
+    entries.sort(key=lambda d: d["name"])
+    return entries
+
+
 @app.get("/api/browse-directories")
 async def browse_directories(path: Optional[str] = None):
     """
@@ -326,23 +537,22 @@ async def browse_directories(path: Optional[str] = None):
             ]
             
             # Plattformspezifische Verzeichnisse hinzufügen
-            if platform.system() == "Darwin":  # macOS
+            if _PLATFORM == "Darwin":  # macOS
                 if os.path.exists("/Users"):
                     directories.append({"path": "/Users", "name": "Benutzerverzeichnisse"})
                 if os.path.exists("/Volumes"):
                     directories.append({"path": "/Volumes", "name": "Volumes (externe Laufwerke)"})
-            elif platform.system() == "Windows":
+            elif _PLATFORM == "Windows":
                 # Windows-Benutzerverzeichnis
                 users_dir = os.path.join(os.environ.get("SystemDrive", "C:\\"), "Users")
                 if os.path.exists(users_dir):
                     directories.append({"path": users_dir, "name": "Benutzerverzeichnisse"})
                 # Laufwerke auflisten
-                import string
                 available_drives = [f"{d}:\\" for d in string.ascii_uppercase if os.path.exists(f"{d}:\\")] 
                 if available_drives:
                     for drive in available_drives:
                         directories.append({"path": drive, "name": f"Laufwerk {drive[0]}:"})
-            elif platform.system() == "Linux":
+            elif _PLATFORM == "Linux":
                 if os.path.exists("/home"):
                     directories.append({"path": "/home", "name": "Benutzerverzeichnisse"})
                 if os.path.exists("/media"):
@@ -352,21 +562,16 @@ async def browse_directories(path: Optional[str] = None):
 
         else:
             # Prüfe, ob der angegebene Pfad existiert und ein Verzeichnis ist
-            if not os.path.exists(path) or not os.path.isdir(path):
+            if not os.path.isdir(path):
                 return JSONResponse(
-                    {"error": f"Pfad existiert nicht oder ist kein Verzeichnis: {path}"}, 
+                    {"error": f"Pfad existiert nicht oder ist kein Verzeichnis: {path}"},
                     status_code=400
                 )
-            
-            # Liste alle Unterverzeichnisse des angegebenen Pfads auf
-            directories = []
-            for item in os.listdir(path):
-                item_path = os.path.join(path, item)
-                if os.path.isdir(item_path):
-                    directories.append({"path": item_path, "name": item})
-            
-            # Sortiere nach Namen
-            directories.sort(key=lambda x: x["name"])
+
+            # Verzeichnis-Scan im Thread-Pool: auf Netzlaufwerken kann das
+            # hunderte Millisekunden dauern und würde den Event-Loop
+            # (und damit alle WebSocket-Broadcasts) blockieren
+            directories = await asyncio.to_thread(_scan_subdirectories, path)
         
         return JSONResponse({
             "success": True, 
@@ -399,9 +604,6 @@ async def transcribe_audio_api(
     dialect_normalization: bool = Form(False)
 ):
     try:
-        # Import here to avoid circular imports
-        from ..module1_transcribe import transcribe_audio
-        
         # Bestimme die zu transkribierende Audiodatei
         if audio_file is None and pre_extracted_audio is None:
             return JSONResponse(
@@ -419,9 +621,13 @@ async def transcribe_audio_api(
             os.makedirs(temp_dir, exist_ok=True)
             
             temp_file = temp_dir / audio_file.filename
+            # Upload in 1-MiB-Stücken auf die Platte streamen, statt die
+            # ganze Datei in den Speicher zu lesen; der blockierende write
+            # läuft im Thread-Pool, damit der Event-Loop frei bleibt
             with open(temp_file, "wb") as f:
-                f.write(await audio_file.read())
-            
+                while chunk := await audio_file.read(1 << 20):
+                    await asyncio.to_thread(f.write, chunk)
+
             audio_path = str(temp_file)
             logger.info(f"Hochgeladene Audiodatei gespeichert unter: {audio_path}")
         
@@ -458,8 +664,11 @@ async def transcribe_audio_api(
             
         # Checkboxwert "true"/"false" zu bool konvertieren
         srt_linebreaks_bool = (str(srt_linebreaks).lower() == "true")
-        # Transkribiere die Audiodatei
-        result = transcribe_audio(
+        # Transkribiere die Audiodatei — der synchrone, minutenlange Aufruf
+        # läuft im Thread-Pool, damit der Event-Loop (WebSockets, weitere
+        # Requests) währenddessen nicht blockiert
+        result = await asyncio.to_thread(
+            module1_transcribe.transcribe_audio,
             audio_path=audio_path,
             output_format=output_format,
             language=language,
@@ -478,8 +687,9 @@ async def transcribe_audio_api(
             # Für SRT-Format lesen wir direkt aus der Datei, um Zeitstempel zu erhalten
             if result.success and result.output_file and os.path.exists(result.output_file):
                 try:
-                    with open(result.output_file, 'r', encoding='utf-8') as f:
-                        srt_content = f.read()
+                    srt_content = await asyncio.to_thread(
+                        Path(result.output_file).read_text, encoding='utf-8'
+                    )
                     # Aktualisiere den Text in der Antwort
                     result.text = srt_content
                     logger.info(f"SRT-Inhalt für Anzeige gelesen, Länge: {len(srt_content)} Zeichen")
@@ -498,15 +708,12 @@ async def transcribe_audio_api(
 
                 logger.info(f"Running text correction with level: {correction_level}, dialect_normalization: {dialect_normalization}")
 
-                # Import correction module
-                from ..module5_text_correction import correct_transcription
-
                 # Generate a user ID for progress tracking
                 import uuid
                 user_id = str(uuid.uuid4())[:8]
 
                 # Run correction
-                correction_result = await correct_transcription(
+                correction_result = await module5_text_correction.correct_transcription(
                     transcription_file=result.output_file,
                     enable_correction=True,
                     correction_level=correction_level,
@@ -636,6 +843,38 @@ async def transcribe_audio_api(
         )
 
 
+def _probe_model_file(path: str) -> Dict:
+    """Prüfe eine Modelldatei mit einem stat und einer 4-Byte-Leseprobe.
+
+    Ersetzt die Kette exists/is_file/access/stat (vier Syscalls für
+    denselben Inode) durch einen einzigen stat plus open+read(4).
+    """
+    result = {
+        "exists": False,
+        "is_file": False,
+        "readable": False,
+        "size_gb": 0,
+        "header": None,
+        "read_error": None,
+    }
+    try:
+        st = os.stat(path)
+    except OSError:
+        return result
+    result["exists"] = True
+    if not stat_module.S_ISREG(st.st_mode):
+        return result
+    result["is_file"] = True
+    result["size_gb"] = st.st_size / (1024 ** 3)
+    try:
+        with open(path, "rb") as f:
+            result["header"] = f.read(4)
+        result["readable"] = True
+    except OSError as e:
+        result["read_error"] = str(e)
+    return result
+
+
 @app.get("/api/models/validate")
 async def validate_model_api(model_path: str = None):
     """
@@ -648,9 +887,6 @@ async def validate_model_api(model_path: str = None):
         JSON response with validation results
     """
     try:
-        import os
-        from pathlib import Path
-
         # Use provided path or default
         if model_path:
             path = Path(model_path)
@@ -658,32 +894,35 @@ async def validate_model_api(model_path: str = None):
             # Use default LeoLM path
             path = Path("/Users/denniswestermann/.lmstudio/models/mradermacher/LeoLM-hesseianai-13b-chat-GGUF/LeoLM-hesseianai-13b-chat.Q4_K_M.gguf")
 
+        # Ein stat plus eine 4-Byte-Leseprobe im Thread-Pool statt
+        # exists/is_file/access/stat als vier einzelne Syscalls auf dem
+        # Event-Loop
+        probe = await asyncio.to_thread(_probe_model_file, str(path))
+
         validation_result = {
             "path": str(path),
-            "exists": path.exists(),
-            "is_file": path.is_file() if path.exists() else False,
-            "readable": os.access(str(path), os.R_OK) if path.exists() else False,
-            "size_gb": path.stat().st_size / (1024**3) if path.exists() and path.is_file() else 0,
+            "exists": probe["exists"],
+            "is_file": probe["is_file"],
+            "readable": probe["readable"],
+            "size_gb": probe["size_gb"],
             "format_valid": False,
             "format_details": None,
             "recommendation": None
         }
 
         # Check file format if it exists
-        if validation_result["exists"] and validation_result["is_file"]:
-            try:
-                with open(path, 'rb') as f:
-                    header = f.read(4)
-                    if header == b'GGUF':
-                        validation_result["format_valid"] = True
-                        validation_result["format_details"] = "Valid GGUF format detected"
-                        validation_result["recommendation"] = "Model file appears valid for use"
-                    else:
-                        validation_result["format_details"] = f"Invalid header: {header.hex()}"
-                        validation_result["recommendation"] = "File is not in GGUF format. Download a GGUF model."
-            except Exception as e:
-                validation_result["format_details"] = f"Could not read file: {str(e)}"
+        if probe["is_file"]:
+            header = probe["header"]
+            if header == b'GGUF':
+                validation_result["format_valid"] = True
+                validation_result["format_details"] = "Valid GGUF format detected"
+                validation_result["recommendation"] = "Model file appears valid for use"
+            elif probe["read_error"] is not None:
+                validation_result["format_details"] = f"Could not read file: {probe['read_error']}"
                 validation_result["recommendation"] = "Unable to validate file format"
+            else:
+                validation_result["format_details"] = f"Invalid header: {header.hex()}"
+                validation_result["recommendation"] = "File is not in GGUF format. Download a GGUF model."
         else:
             validation_result["recommendation"] = "Model file not found. Please download the LeoLM model."
 
@@ -700,6 +939,64 @@ async def validate_model_api(model_path: str = None):
         }, status_code=500)
 
 
+def _iter_gguf(root: str):
+    """
+    Durchläuft einen Verzeichnisbaum rekursiv per os.scandir und liefert
+    (Pfad, stat_result) für jede .gguf-Datei.
+
+    Gegenüber Path.rglob entfällt der zusätzliche stat-Syscall pro Datei:
+    Dateityp kommt aus dem dirent, das stat-Ergebnis wird aus dem
+    scandir-Cache wiederverwendet. Symlinks werden nicht verfolgt.
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from _iter_gguf(entry.path)
+                    elif entry.name.endswith(".gguf") and entry.is_file(follow_symlinks=False):
+                        yield entry.path, entry.stat()
+                except OSError:
+                    continue
+    except (PermissionError, FileNotFoundError):
+        return
+
+
+# Korrekturstufen nach aufsteigender RAM-Anforderung; der Endpunkt
+# schneidet per bisect die für das System verfügbaren Stufen heraus
+_CORRECTION_LEVEL_THRESHOLDS = [2.0, 4.0, 8.0]
+_CORRECTION_LEVEL_ENTRIES = [
+    {
+        "level": "minimal",
+        "name": "Minimal Correction",
+        "description": "Basic grammar and punctuation fixes",
+        "ram_required_gb": 2.0
+    },
+    {
+        "level": "standard",
+        "name": "Standard Correction",
+        "description": "Grammar, punctuation, and style improvements",
+        "ram_required_gb": 4.0
+    },
+    {
+        "level": "enhanced",
+        "name": "Enhanced Correction",
+        "description": "Full AI-powered text enhancement with context awareness",
+        "ram_required_gb": 8.0
+    },
+]
+
+# Quantisierungs-Tag im Dateinamen in einem Regex-Durchlauf erkennen;
+# längere Alternativen stehen vorn, damit q4_k_m nicht als q4_k matcht
+_QUANT_RE = re.compile(r"(q4_k_m|q5_k_m|q2_k|q3_k|q4_k|q5_k|q6_k|q8_0)", re.IGNORECASE)
+
+# Kurzlebiger Cache für /api/models/available: Modellverzeichnisse
+# ändern sich selten, die Traversierung kann aber teuer sein
+_available_models_cache: Optional[Dict] = None
+_available_models_cache_time: float = 0.0
+_AVAILABLE_MODELS_CACHE_TTL = 60.0  # Sekunden
+
+
 @app.get("/api/models/available")
 async def list_available_models_api():
     """
@@ -708,55 +1005,76 @@ async def list_available_models_api():
     Returns:
         JSON response with list of found models
     """
+    global _available_models_cache, _available_models_cache_time
+
     try:
-        from pathlib import Path
 
-        # Common model directories to search
+        now = time.monotonic()
+        if (_available_models_cache is not None
+                and now - _available_models_cache_time < _AVAILABLE_MODELS_CACHE_TTL):
+            return _available_models_cache
+
+        # Suchpfade aus der Konfiguration (["models"]["search_paths"]),
+        # mit sinnvollen Defaults; jeder zusätzliche Pfad kostet pro
+        # Request mindestens einen stat-Syscall
         search_paths = [
-            Path.home() / ".lmstudio" / "models",
-            Path.home() / "Models",
-            Path("/Users/denniswestermann/Desktop/Coding Projekte/whisper_clean/models"),
-            Path("/opt/models"),
-            Path("/usr/local/models")
+            Path(p).expanduser()
+            for p in config.get("models", {}).get("search_paths", [
+                "~/.lmstudio/models",
+                "~/Models",
+                "/opt/models",
+                "/usr/local/models",
+            ])
         ]
 
+        # exists() nur einmal pro Pfad; die Liste wird für Traversierung
+        # und Response gleichermaßen verwendet
+        existing_roots = [p for p in search_paths if p.exists()]
+
         found_models = []
 
-        for base_path in search_paths:
-            if not base_path.exists():
-                continue
+        # Alle Wurzeln parallel im Thread-Pool durchsuchen — liegen sie
+        # auf verschiedenen Volumes, überlappen sich die Syscall-Latenzen
+        root_scans = await asyncio.gather(*(
+            asyncio.to_thread(lambda p: list(_iter_gguf(p)), str(base_path))
+            for base_path in existing_roots
+        ))
 
-            # Search for GGUF files
-            for gguf_file in base_path.rglob("*.gguf"):
-                try:
-                    model_info = {
-                        "path": str(gguf_file),
-                        "name": gguf_file.name,
-                        "size_gb": gguf_file.stat().st_size / (1024**3),
-                        "parent_dir": gguf_file.parent.name,
-                        "quantization": None
-                    }
+        for gguf_path, gguf_stat in (hit for scan in root_scans for hit in scan):
+            try:
+                file_name = os.path.basename(gguf_path)
+                model_info = {
+                    "path": gguf_path,
+                    "name": file_name,
+                    "size_gb": gguf_stat.st_size / (1024**3),
+                    "parent_dir": os.path.basename(os.path.dirname(gguf_path)),
+                    "quantization": None
+                }
 
-                    # Try to extract quantization from filename
-                    name_lower = gguf_file.name.lower()
-                    for quant in ["q2_k", "q3_k", "q4_k", "q4_k_m", "q5_k", "q5_k_m", "q6_k", "q8_0"]:
-                        if quant in name_lower:
-                            model_info["quantization"] = quant.upper()
-                            break
+                # Try to extract quantization from filename
+                quant_match = _QUANT_RE.search(file_name)
+                if quant_match:
+                    model_info["quantization"] = quant_match.group(1).upper()
 
-                    found_models.append(model_info)
-                except Exception as e:
-                    logger.warning(f"Error processing model file {gguf_file}: {e}")
+                found_models.append(model_info)
+            except Exception as e:
+                logger.warning(f"Error processing model file {gguf_path}: {e}")
 
         # Sort by size
         found_models.sort(key=lambda x: x["size_gb"])
 
-        return JSONResponse({
+        payload = {
             "success": True,
             "models": found_models,
             "count": len(found_models),
-            "search_paths": [str(p) for p in search_paths if p.exists()]
-        })
+            "search_paths": [str(p) for p in existing_roots]
+        }
+        _available_models_cache = payload
+        _available_models_cache_time = now
+
+        # Dict direkt zurückgeben: so greift die default_response_class
+        # (ORJSONResponse, falls orjson installiert ist)
+        return payload
 
     except Exception as e:
         logger.error(f"Error listing models: {e}")
@@ -776,14 +1094,14 @@ async def correction_status_api():
         JSON response with correction availability, model info, and requirements
     """
     try:
-        from ..module5_text_correction import check_correction_availability
 
-        status = check_correction_availability()
+        status = module5_text_correction.check_correction_availability()
 
-        # Add additional system information
-        import psutil
+        # Add additional system information; interval=None liefert den
+        # Durchschnitt seit dem letzten Aufruf, statt den Worker für
+        # eine volle Sekunde schlafen zu legen
         cpu_count = psutil.cpu_count()
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = psutil.cpu_percent(interval=None)
 
         status["system_info"] = {
             "cpu_count": cpu_count,
@@ -791,33 +1109,12 @@ async def correction_status_api():
             "platform": "macOS" if os.name == "posix" else "Windows" if os.name == "nt" else "Linux"
         }
 
-        # Add available correction levels based on resources
+        # Add available correction levels based on resources; die
+        # Stufenlisten sind statisch und werden beim Modul-Import
+        # vorbereitet, hier genügt ein bisect über die RAM-Schwellen
         available_ram_gb = status.get("available_ram_gb", 0)
-        status["available_levels"] = []
-
-        if available_ram_gb >= 2.0:
-            status["available_levels"].append({
-                "level": "minimal",
-                "name": "Minimal Correction",
-                "description": "Basic grammar and punctuation fixes",
-                "ram_required_gb": 2.0
-            })
-
-        if available_ram_gb >= 4.0:
-            status["available_levels"].append({
-                "level": "standard",
-                "name": "Standard Correction",
-                "description": "Grammar, punctuation, and style improvements",
-                "ram_required_gb": 4.0
-            })
-
-        if available_ram_gb >= 8.0:
-            status["available_levels"].append({
-                "level": "enhanced",
-                "name": "Enhanced Correction",
-                "description": "Full AI-powered text enhancement with context awareness",
-                "ram_required_gb": 8.0
-            })
+        idx = bisect.bisect_right(_CORRECTION_LEVEL_THRESHOLDS, available_ram_gb)
+        status["available_levels"] = _CORRECTION_LEVEL_ENTRIES[:idx]
 
         return JSONResponse({
             "success": True,
@@ -860,16 +1157,16 @@ async def extract_audio_api(
         JSON response with extraction result
     """
     try:
-        # Import here to avoid circular imports
-        from ..module2_extract import extract_audio
-        
         # Save uploaded file to temporary location
         temp_dir = Path(config["output"]["default_directory"]) / "temp"
         os.makedirs(temp_dir, exist_ok=True)
         
         temp_file = temp_dir / video_file.filename
+        # Upload in 1-MiB-Stücken auf die Platte streamen, statt das
+        # ganze Video in den Speicher zu lesen
         with open(temp_file, "wb") as f:
-            f.write(await video_file.read())
+            while chunk := await video_file.read(1 << 20):
+                await asyncio.to_thread(f.write, chunk)
         
         # Extract audio
         result = extract_audio(
@@ -1013,10 +1310,6 @@ async def get_models_api():
         JSON response with available models and their details (size, description, etc.)
     """
     try:
-        # Import here to avoid circular imports
-        from ..module1_transcribe import list_models
-        from ..core.model_manager import get_recommended_models, get_downloaded_models, get_model_info
-        
         # Get available models
         all_models = list_models(config)
         
@@ -1024,29 +1317,36 @@ async def get_models_api():
         model_dir = config.get("whisper", {}).get("model_path", "~/.whisper-models")
         downloaded = get_downloaded_models(model_dir)
         
-        # Get recommended models with detailed information
-        recommended_models = get_recommended_models()
-        
+        # Get recommended models with detailed information (flache
+        # Kopien, da is_downloaded unten pro Request gesetzt wird)
+        recommended_models = [dict(m) for m in _cached_recommended_models()]
+
+        # Mitgliedschaftstests über Sets statt Listen — die Namenslisten
+        # werden sonst pro Schleifendurchlauf neu aufgebaut (O(N*M))
+        downloaded_set = set(downloaded)
+        recommended_names = {m["name"] for m in recommended_models}
+
         # Mark which models are downloaded
         for model in recommended_models:
-            model["is_downloaded"] = model["name"] in downloaded
-            
+            model["is_downloaded"] = model["name"] in downloaded_set
+
         # Include legacy models that might be downloaded but not in our recommendations
         legacy_models = []
         for model_name in all_models:
-            if model_name not in [m["name"] for m in recommended_models]:
+            if model_name not in recommended_names:
                 model_info = get_model_info(model_name)
-                model_info["is_downloaded"] = model_name in downloaded
+                model_info["is_downloaded"] = model_name in downloaded_set
                 model_info["is_legacy"] = True  # Mark as legacy model
                 legacy_models.append(model_info)
         
-        # Return result
-        return JSONResponse({
-            "success": True, 
+        # Dict direkt zurückgeben, damit die default_response_class
+        # (ORJSONResponse, falls verfügbar) serialisiert
+        return {
+            "success": True,
             "recommended_models": recommended_models,
             "legacy_models": legacy_models,
             "downloaded_models": downloaded
-        })
+        }
     
     except Exception as e:
         logger.error(f"Error getting models: {e}")
@@ -1068,10 +1368,6 @@ async def delete_model_api(model_name: str):
         JSON response indicating success or failure
     """
     try:
-        # Import here to avoid circular imports
-        from pathlib import Path
-        import os
-        
         # Get model directory from config
         model_dir = config.get("whisper", {}).get("model_path", "~/.whisper-models")
         model_dir_path = Path(model_dir).expanduser().resolve()
@@ -1081,28 +1377,28 @@ async def delete_model_api(model_name: str):
         model_file_path = model_dir_path / model_filename
         
         logger.info(f"Attempting to delete model: {model_file_path}")
-        
-        # Check if file exists
-        if not model_file_path.exists():
-            return JSONResponse({
-                "success": False, 
-                "error": f"Model file {model_filename} not found in {model_dir}"
-            }, status_code=404)
-        
-        # Delete the file
+
+        # Direkt löschen statt exists()-dann-remove: spart den stat-Syscall
+        # und schließt das TOCTOU-Fenster zwischen Prüfung und Löschung
         try:
             os.remove(model_file_path)
-            logger.info(f"Successfully deleted model: {model_file_path}")
+        except FileNotFoundError:
             return JSONResponse({
-                "success": True, 
-                "message": f"Model {model_name} deleted successfully"
-            })
+                "success": False,
+                "error": f"Model file {model_filename} not found in {model_dir}"
+            }, status_code=404)
         except OSError as e:
             logger.error(f"Error deleting model file {model_file_path}: {e}")
             return JSONResponse({
-                "success": False, 
+                "success": False,
                 "error": f"Could not delete model file: {str(e)}"
             }, status_code=500)
+
+        logger.info(f"Successfully deleted model: {model_file_path}")
+        return JSONResponse({
+            "success": True,
+            "message": f"Model {model_name} deleted successfully"
+        })
     
     except Exception as e:
         logger.error(f"Error in delete_model_api: {e}")
@@ -1123,7 +1419,7 @@ async def models_page(request: Request):
             "request": request,
             "title": "Modellverwaltung",
             "app_version": VERSION,
-            "available_models": [model.value for model in WhisperModel],
+            "available_models": _WHISPER_MODEL_VALUES,
             "model_directory": config["whisper"]["model_path"],
             "downloaded_models": downloaded_models
         }
@@ -1137,13 +1433,12 @@ async def download_model_api(model_name: str, background_tasks: BackgroundTasks)
     logger.info(f"Received request to download model: {model_name}")
     
     # Basic validation if model_name is known
-    if model_name not in [m.value for m in WhisperModel]:
+    if model_name not in _WHISPER_MODEL_VALUE_SET:
         raise HTTPException(status_code=404, detail=f"Model '{model_name}' not found or invalid.")
     
     # --- Run download in background --- 
     # This is better UX as it doesn't block the API response.
     # The actual download status/progress should be sent via WebSocket.
-    from ..core.model_manager import download_model # Import here or globally
     background_tasks.add_task(download_model, model_name, config["whisper"]["model_path"])
     
     # Immediately return success, indicating the download *started*
@@ -1165,13 +1460,10 @@ async def set_model_directory_api(payload: SetDirectoryPayload):
              # ensure_directory_exists logs the error
             raise HTTPException(status_code=400, detail=f"Konnte Verzeichnis nicht erstellen oder darauf zugreifen: {new_directory_path}")
  
-        # Check write permissions (basic check)
-        test_file = new_directory_path / ".cascade_write_test"
-        try:
-            test_file.touch()
-            test_file.unlink()
-        except OSError as e:
-            logger.error(f"Schreibberechtigungstest fehlgeschlagen für {new_directory_path}: {e}")
+        # Check write permissions: access(2) statt Testdatei anlegen und
+        # löschen — keine Mutation, kein Anstoßen von Verzeichnis-Watchern
+        if not os.access(new_directory_path, os.W_OK, effective_ids=os.access in os.supports_effective_ids):
+            logger.error(f"Schreibberechtigungstest fehlgeschlagen für {new_directory_path}")
             raise HTTPException(status_code=400, detail=f"Keine Schreibberechtigung im Verzeichnis: {new_directory_path}")
  
         # Update the config dictionary
@@ -1185,6 +1477,10 @@ async def set_model_directory_api(payload: SetDirectoryPayload):
             # save_config logs the error
              raise HTTPException(status_code=500, detail="Fehler beim Speichern der Konfigurationsdatei.")
  
+        # Geteilte FileManager-Instanz verwerfen, damit sie die neue
+        # Konfiguration beim nächsten Zugriff neu einliest
+        _invalidate_file_manager()
+
         logger.info(f"Model directory successfully updated to: {config['whisper']['model_path']}")
         return {"status": "success", "message": f"Modellverzeichnis erfolgreich auf '{config['whisper']['model_path']}' gesetzt.", "new_path": config['whisper']['model_path']}
  
@@ -1203,36 +1499,28 @@ async def set_model_directory_api(payload: SetDirectoryPayload):
 @app.get("/api/disk/status")
 async def disk_status_api():
     """API endpoint für die Überwachung des Festplattenspeichers."""
-    from ..core.file_manager import FileManager
-    file_manager = FileManager()
-    return file_manager.monitor_disk_space()
+    return await _get_disk_stats()
 
 @app.post("/api/disk/cleanup")
 async def disk_cleanup_api(age_hours: int = 24):
     """API endpoint für die manuelle Bereinigung temporärer Dateien."""
-    from ..core.file_manager import FileManager
-    file_manager = FileManager()
-    return file_manager.cleanup_temp_directory(age_threshold_hours=age_hours)
+    file_manager = _get_file_manager()
+    return await asyncio.to_thread(file_manager.cleanup_temp_directory, age_threshold_hours=age_hours)
 
 @app.post("/api/disk/emergency-cleanup")
 async def disk_emergency_cleanup_api():
     """API endpoint für die Notfallbereinigung bei kritisch niedrigem Speicherplatz."""
-    from ..core.file_manager import FileManager
-    file_manager = FileManager()
-    return file_manager.emergency_cleanup()
+    file_manager = _get_file_manager()
+    return await asyncio.to_thread(file_manager.emergency_cleanup)
 
 @app.get("/disk", response_class=HTMLResponse)
 async def disk_page(request: Request):
     """Render disk management page."""
-    from ..core.file_manager import FileManager
-    from ..core.config import load_config
     
-    # Lade Konfiguration und erstelle FileManager
+    # Lade Konfiguration; Disk-Statistiken kommen aus dem geteilten
+    # Snapshot (höchstens 30 s alt)
     config = load_config()
-    file_manager = FileManager(config)
-    
-    # Disk-Statistiken und Konfiguration
-    disk_stats = file_manager.monitor_disk_space()
+    disk_stats = await _get_disk_stats()
     disk_config = config.get("disk_management", {})
     
     return templates.TemplateResponse(
@@ -1263,7 +1551,7 @@ async def compare_page(request: Request):
     )
 
 
-@app.post("/api/compare-transcripts", response_class=JSONResponse)
+@app.post("/api/compare-transcripts")
 async def compare_transcripts_api(
     srtFile: UploadFile = File(...),
     jsonFile: UploadFile = File(...)
@@ -1278,20 +1566,18 @@ async def compare_transcripts_api(
     Returns:
         JSONResponse mit Vergleichsergebnissen
     """
-    from .compare_utils import parse_srt_file, compare_segments
     
     logger.info(f"Vergleiche Dateien: {srtFile.filename} und {jsonFile.filename}")
     
     try:
-        # SRT-Datei einlesen und parsen
-        srt_content = await srtFile.read()
-        srt_content = srt_content.decode("utf-8")
-        srt_segments = parse_srt_file(srt_content)
-        
-        # JSON-Datei einlesen und parsen
-        json_content = await jsonFile.read()
-        json_content = json_content.decode("utf-8")
-        json_segments = json.loads(json_content)
+        # SRT-Datei einlesen und parsen (eine Dekodierung, keine
+        # zusätzliche Zwischenkopie)
+        srt_segments = parse_srt_file((await srtFile.read()).decode("utf-8"))
+
+        # JSON-Datei einlesen und parsen; orjson (falls installiert)
+        # parst Bytes direkt mit dem C-Parser, sonst stdlib-json
+        json_bytes = await jsonFile.read()
+        json_segments = orjson.loads(json_bytes) if orjson is not None else json.loads(json_bytes)
         
         # Vergleich durchführen mit Standardtoleranz von 300ms
         comparison_results = compare_segments(srt_segments, json_segments, time_tolerance=300)
@@ -1314,7 +1600,6 @@ async def compare_transcripts_api(
 @app.post("/api/disk/config")
 async def update_disk_config(request: Request):
     """API für die Aktualisierung der Speicherkonfiguration."""
-    from ..core.config import load_config, save_config
     
     # Lade aktuelle Konfiguration
     config = load_config()
@@ -1336,7 +1621,12 @@ async def update_disk_config(request: Request):
         
         # Speichere Konfiguration
         save_config(config, None)  # None verwendet den Standardpfad
-        
+
+        # Geteilte FileManager-Instanz verwerfen, damit die neuen
+        # Speicherverwaltungs-Einstellungen greifen
+        _invalidate_file_manager()
+
+
         # Erfolgreiche Antwort
         return JSONResponse({
             "success": True,
@@ -1359,46 +1649,56 @@ async def update_disk_config(request: Request):
 @app.get("/api/disk/check-batch-processing")
 async def check_batch_processing_space():
     """Prüft, ob genügend Speicherplatz für Stapelverarbeitung verfügbar ist."""
-    from ..core.file_manager import FileManager
-    from ..core.config import load_config
     
     try:
         # Lade Konfiguration und prüfe Speicherplatz
         config = load_config()
-        file_manager = FileManager(config)
-        disk_stats = file_manager.monitor_disk_space()
-        
+        disk_stats = await _get_disk_stats()
+
         # Prüfe, ob genügend Speicherplatz für Stapelverarbeitung verfügbar ist
         batch_threshold = config.get("disk_management", {}).get("batch_warning_threshold_gb", 5.0)
         has_enough_space = disk_stats["free_gb"] >= batch_threshold
         
-        return jsonify({
+        payload = {
             "has_enough_space": has_enough_space,
             "free_space_gb": disk_stats["free_gb"],
             "required_space_gb": batch_threshold,
-            "message": f"Hinweis: Für die Stapelverarbeitung werden mindestens {batch_threshold} GB freier Speicherplatz empfohlen. "
-                       f"Aktuell sind {disk_stats['free_gb']:.1f} GB frei. "
-                       f"Bei zu wenig Speicherplatz könnte die Verarbeitung abbrechen."
-        })
+        }
+        # Hinweistext nur bauen, wenn er auch angezeigt wird
+        if not has_enough_space:
+            payload["message"] = (
+                f"Hinweis: Für die Stapelverarbeitung werden mindestens {batch_threshold} GB freier Speicherplatz empfohlen. "
+                f"Aktuell sind {disk_stats['free_gb']:.1f} GB frei. "
+                f"Bei zu wenig Speicherplatz könnte die Verarbeitung abbrechen."
+            )
+        return JSONResponse(payload)
     except Exception as e:
         logger.error(f"Fehler bei der Speicherprüfung für Stapelverarbeitung: {e}")
-        return jsonify({
+        return JSONResponse({
             "has_enough_space": False,
             "error": str(e)
-        }), 500
+        }, status_code=500)
 
 # Startup-Event für Hintergrundaufgaben wie Festplattenbereinigung
 @app.on_event("startup")
 async def startup_event():
     """Start background tasks when the server starts."""
-    # Import disk management module
-    from ..core.file_manager import FileManager
-    
+    global _progress_dirty
+
+    # Server-Loop am Event-Bus registrieren: publish() aus Worker-Threads
+    # (z. B. transcribe_audio in asyncio.to_thread) erreicht so die
+    # async-Handler per run_coroutine_threadsafe
+    set_event_loop(asyncio.get_running_loop())
+
+    # Koaleszierten Fortschritts-Flusher starten (Event im Server-Loop anlegen)
+    _progress_dirty = asyncio.Event()
+    asyncio.create_task(_progress_flusher())
+
     # Create background task for disk monitoring
     asyncio.create_task(monitor_disk_space_task())
     
     # Perform initial disk space check and cleanup if needed
-    file_manager = FileManager()
+    file_manager = _get_file_manager()
     space_info = file_manager.monitor_disk_space()
     logger.info(f"Initial disk space check: {space_info['free_gb']} GB free")
     
@@ -1411,21 +1711,28 @@ async def startup_event():
 # Disk space monitoring background task
 async def monitor_disk_space_task():
     """Background task to monitor disk space periodically."""
+    global _DISK_SNAPSHOT, _DISK_SNAPSHOT_TS
+
     try:
-        from ..core.file_manager import FileManager
-        file_manager = FileManager()
         while True:
-            # Check disk space every 5 minutes
-            space_stats = file_manager.monitor_disk_space()
-            
+            # Pro Durchlauf über den Getter, damit eine zwischenzeitlich
+            # verworfene Instanz (Konfigänderung) nicht weiterlebt
+            file_manager = _get_file_manager()
+            space_stats = await asyncio.to_thread(file_manager.monitor_disk_space)
+
+            # Snapshot für die HTTP-Endpunkte aktualisieren
+            _DISK_SNAPSHOT = space_stats
+            _DISK_SNAPSHOT_TS = time.monotonic()
+
             # If disk space is critically low, perform emergency cleanup
             if space_stats.get("status") == "warning" and space_stats.get("free_gb", 0) < 1.0:
                 logger.warning("Critical disk space detected, performing emergency cleanup")
-                cleanup_result = file_manager.emergency_cleanup()
+                cleanup_result = await asyncio.to_thread(file_manager.emergency_cleanup)
                 logger.info(f"Emergency cleanup result: {cleanup_result}")
-            
-            # Wait for 5 minutes
-            await asyncio.sleep(300)
+
+            # Adaptiv pollen: bei knappem Speicher alle 30 s, sonst alle
+            # 5 Minuten
+            await asyncio.sleep(30 if space_stats.get("free_gb", 0) < 2.0 else 300)
     except Exception as e:
         logger.error(f"Error in disk space monitoring task: {e}")
 
@@ -1433,9 +1740,7 @@ def start_web_server(host: str = "0.0.0.0", port: int = 8000, config_path: Optio
     """Startet den FastAPI Webserver."""
     global config
     config = load_config(config_path)
- 
-    # Event-Handler für Fortschrittsanzeigen registrieren
-    subscribe(EventType.PROGRESS_UPDATE, progress_event_handler)
 
+    # Event-Handler sind bereits beim Modul-Import registriert
     logger.info(f"Starting web server on {host}:{port}")
-    uvicorn.run(app, host=host, port=port)
+    uvicorn.run(app, host=host, port=port, loop="uvloop" if uvloop is not None else "auto")
@@ -5,6 +5,12 @@ import json
 import difflib
 from typing import Dict, List
 
+# Regex-Muster für SRT-Parsing, einmalig beim Modul-Import kompiliert
+_SRT_PATTERN = re.compile(
+    r'(\d+)\s*\n(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})\s*\n([\s\S]*?)(?=\n\s*\n\s*\d+\s*\n|$)'
+)
+
+
 def parse_srt_file(content: str) -> List[Dict]:
     """
     Parst den Inhalt einer SRT-Datei und gibt eine Liste von Segmenten zurück.
@@ -17,9 +23,7 @@ def parse_srt_file(content: str) -> List[Dict]:
     """
     segments = []
     
-    # Regex-Muster für SRT-Parsing
-    pattern = r'(\d+)\s*\n(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})\s*\n([\s\S]*?)(?=\n\s*\n\s*\d+\s*\n|$)'
-    matches = re.finditer(pattern, content)
+    matches = _SRT_PATTERN.finditer(content)
     
     for match in matches:
         index = int(match.group(1))
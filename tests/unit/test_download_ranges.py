@@ -0,0 +1,171 @@
+"""
+Unit Tests for the parallel range downloader in scripts/download_models.py
+
+Tests cover:
+- _AdaptiveLimiter capacity adjustments (AIMD, floor/cap, deferred debt)
+- Range state persistence (save/load roundtrip, corrupt state handling)
+- Resume behaviour of _download_ranges_async against a fake range server
+"""
+
+import asyncio
+import importlib.util
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# The downloader lives in scripts/, which is not a package; load it directly
+project_root = Path(__file__).parent.parent.parent
+_spec = importlib.util.spec_from_file_location(
+    "download_models", project_root / "scripts" / "download_models.py"
+)
+download_models = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(download_models)
+
+
+class TestAdaptiveLimiter:
+    """Test suite for the AIMD concurrency limiter"""
+
+    def test_initial_value(self):
+        limiter = download_models._AdaptiveLimiter(initial=4)
+        assert limiter.value == 4
+
+    def test_increase_respects_cap(self):
+        limiter = download_models._AdaptiveLimiter(initial=2, cap=3)
+        limiter.increase()
+        limiter.increase()
+        limiter.increase()
+        assert limiter.value == 3
+
+    def test_decrease_respects_floor(self):
+        limiter = download_models._AdaptiveLimiter(initial=2, floor=1)
+        limiter.decrease()
+        limiter.decrease()
+        limiter.decrease()
+        assert limiter.value == 1
+
+    async def test_decrease_swallows_next_release(self):
+        """A reduction must not free a slot until a holder releases."""
+        limiter = download_models._AdaptiveLimiter(initial=1)
+        await limiter.acquire()
+        limiter.increase()  # capacity 2, one slot free
+        limiter.decrease()  # capacity back to 1; reduction is deferred
+        await limiter.acquire()  # consumes the free slot
+        limiter.release()  # swallowed by the pending reduction
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire(), timeout=0.1)
+
+    async def test_increase_cancels_pending_debt(self):
+        limiter = download_models._AdaptiveLimiter(initial=1)
+        await limiter.acquire()
+        limiter.decrease()  # debt of one pending reduction
+        limiter.increase()  # cancels the debt instead of releasing a slot
+        limiter.release()
+
+        # The released slot must be usable again
+        await asyncio.wait_for(limiter.acquire(), timeout=0.1)
+        assert limiter.value == 1
+
+
+class TestRangeState:
+    """Test suite for the .ranges resume sidecar"""
+
+    def test_state_path_is_sidecar(self, tmp_path):
+        part = tmp_path / "model.gguf.part"
+        assert download_models._range_state_path(part) == tmp_path / "model.gguf.part.ranges"
+
+    def test_save_load_roundtrip(self, tmp_path):
+        part = tmp_path / "model.gguf.part"
+        completed = {(0, 1023), (1024, 2047)}
+        download_models._save_completed_ranges(part, completed)
+        assert download_models._load_completed_ranges(part) == completed
+
+    def test_missing_state_returns_empty(self, tmp_path):
+        assert download_models._load_completed_ranges(tmp_path / "nothing.part") == set()
+
+    def test_corrupt_state_returns_empty(self, tmp_path):
+        part = tmp_path / "model.gguf.part"
+        download_models._range_state_path(part).write_text("not json{")
+        assert download_models._load_completed_ranges(part) == set()
+
+
+class _FakeStreamResponse:
+    """Async context manager mimicking httpx's streamed range response."""
+
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self._payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def aiter_bytes(self):
+        yield self._payload
+
+
+class _FakeRangeClient:
+    """Minimal range-capable HTTP server double recording requests."""
+
+    def __init__(self, data):
+        self._data = data
+        self.requested_ranges = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def head(self, url):
+        return SimpleNamespace(headers={
+            "Content-Length": str(len(self._data)),
+            "Accept-Ranges": "bytes",
+        })
+
+    def stream(self, method, url, headers=None):
+        lo, hi = (int(v) for v in headers["Range"].split("=")[1].split("-"))
+        self.requested_ranges.append((lo, hi))
+        return _FakeStreamResponse(206, self._data[lo:hi + 1])
+
+
+class TestDownloadRangesResume:
+    """Test suite for _download_ranges_async resume behaviour"""
+
+    DATA = b"0123456789abcdef"  # 16 bytes -> four 4-byte ranges
+
+    @pytest.fixture
+    def fake_client(self, monkeypatch):
+        client = _FakeRangeClient(self.DATA)
+        monkeypatch.setattr(download_models.httpx, "AsyncClient",
+                            lambda **kwargs: client)
+        monkeypatch.setattr(download_models, "RANGE_PART_SIZE", 4)
+        return client
+
+    async def test_fresh_download_fetches_all_ranges(self, fake_client, tmp_path):
+        part = tmp_path / "model.gguf.part"
+        ok = await download_models._download_ranges_async("http://x/m", part, conns=2)
+
+        assert ok is True
+        assert part.read_bytes() == self.DATA
+        assert sorted(fake_client.requested_ranges) == [
+            (0, 3), (4, 7), (8, 11), (12, 15)]
+        # Successful completion removes the resume sidecar
+        assert not download_models._range_state_path(part).exists()
+
+    async def test_resume_skips_completed_ranges(self, fake_client, tmp_path):
+        part = tmp_path / "model.gguf.part"
+        # Simulate an interrupted run that already wrote the first range
+        part.write_bytes(self.DATA[:4] + b"\x00" * 12)
+        download_models._save_completed_ranges(part, {(0, 3)})
+
+        ok = await download_models._download_ranges_async("http://x/m", part, conns=2)
+
+        assert ok is True
+        assert part.read_bytes() == self.DATA
+        assert (0, 3) not in fake_client.requested_ranges
+        assert sorted(fake_client.requested_ranges) == [(4, 7), (8, 11), (12, 15)]
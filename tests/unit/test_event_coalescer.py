@@ -0,0 +1,79 @@
+"""
+Unit Tests for the EventCoalescer in core/events.py
+
+Tests cover:
+- Latest-wins replacement of pending events with the same key
+- Keying on payload kind so terminal-output batches never clobber
+  pending percent frames of the same task
+- Flush draining the pending map through the event bus
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.whisper_transcription_tool.core import events
+from src.whisper_transcription_tool.core.events import EventCoalescer, EventType
+
+
+class TestEventCoalescerKeying:
+    """Test suite for EventCoalescer.post pending-map keys"""
+
+    @pytest.fixture
+    def published(self, monkeypatch):
+        """Capture events the coalescer flushes through the bus."""
+        captured = []
+        monkeypatch.setattr(events.event_bus, "publish", captured.append)
+        return captured
+
+    @pytest.fixture
+    def coalescer(self):
+        # Large interval: the background thread never flushes during a
+        # test, so flush() timing stays deterministic
+        return EventCoalescer(interval=3600.0)
+
+    def test_latest_percent_frame_wins(self, coalescer, published):
+        coalescer.post(EventType.PROGRESS_UPDATE, {"task": "t1", "progress": 10})
+        coalescer.post(EventType.PROGRESS_UPDATE, {"task": "t1", "progress": 20})
+        coalescer.flush()
+
+        assert len(published) == 1
+        assert published[0].data["progress"] == 20
+
+    def test_terminal_batch_does_not_clobber_percent_frame(self, coalescer, published):
+        coalescer.post(EventType.PROGRESS_UPDATE, {"task": "t1", "progress": 42})
+        coalescer.post(EventType.PROGRESS_UPDATE,
+                       {"task": "t1", "terminal_output": ["line"]})
+        coalescer.flush()
+
+        assert len(published) == 2
+        payloads = [event.data for event in published]
+        assert {"task": "t1", "progress": 42} in payloads
+        assert {"task": "t1", "terminal_output": ["line"]} in payloads
+
+    def test_distinct_tasks_are_kept_separately(self, coalescer, published):
+        coalescer.post(EventType.PROGRESS_UPDATE, {"task": "t1", "progress": 10})
+        coalescer.post(EventType.PROGRESS_UPDATE, {"task": "t2", "progress": 10})
+        coalescer.flush()
+
+        assert sorted(event.data["task"] for event in published) == ["t1", "t2"]
+
+    def test_distinct_users_are_kept_separately(self, coalescer, published):
+        coalescer.post(EventType.PROGRESS_UPDATE,
+                       {"task": "t1", "user_id": "a", "progress": 10})
+        coalescer.post(EventType.PROGRESS_UPDATE,
+                       {"task": "t1", "user_id": "b", "progress": 10})
+        coalescer.flush()
+
+        assert len(published) == 2
+
+    def test_flush_empties_pending(self, coalescer, published):
+        coalescer.post(EventType.PROGRESS_UPDATE, {"task": "t1", "progress": 10})
+        coalescer.flush()
+        coalescer.flush()
+
+        assert len(published) == 1
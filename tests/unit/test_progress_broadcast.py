@@ -0,0 +1,77 @@
+"""
+Unit Tests for the WebSocket progress broadcast path in the web module
+
+Tests cover:
+- _broadcast fanning a frame out to every registered client queue
+- Drop-oldest behaviour when a slow client's queue is full
+- The last-frame stash used to replay state to reconnecting clients
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.whisper_transcription_tool import web
+
+
+@pytest.fixture
+def client_queue():
+    """Register a fake client connection and clean it up afterwards."""
+    websocket = object()  # only used as a dict key
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+    web._register_progress_socket(websocket, queue)
+    yield queue
+    web._unregister_progress_socket(websocket)
+
+
+class TestBroadcast:
+    """Test suite for _broadcast fan-out and backpressure handling"""
+
+    async def test_frame_reaches_registered_queue(self, client_queue):
+        frame = b'{"task": "t1", "progress": 50}'
+        web._broadcast(frame)
+
+        assert client_queue.get_nowait() == frame
+
+    async def test_full_queue_drops_oldest_keeps_newest(self, client_queue):
+        web._broadcast(b"frame-1")
+        web._broadcast(b"frame-2")
+        web._broadcast(b"frame-3")
+
+        assert client_queue.get_nowait() == b"frame-2"
+        assert client_queue.get_nowait() == b"frame-3"
+        with pytest.raises(asyncio.QueueEmpty):
+            client_queue.get_nowait()
+
+    async def test_slow_client_does_not_starve_others(self, client_queue):
+        fast_ws = object()
+        fast_queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+        web._register_progress_socket(fast_ws, fast_queue)
+        try:
+            for i in range(5):
+                web._broadcast(b"frame-%d" % i)
+
+            # The slow client only keeps the newest frames...
+            assert client_queue.qsize() == 2
+            # ...while the fast client received every one
+            assert fast_queue.qsize() == 5
+            assert fast_queue.get_nowait() == b"frame-0"
+        finally:
+            web._unregister_progress_socket(fast_ws)
+
+    async def test_last_frame_is_stashed_for_replay(self, client_queue):
+        web._broadcast(b"frame-old")
+        web._broadcast(b"frame-new")
+
+        # New connections replay exactly this frame on accept
+        assert web._last_progress_bytes == b"frame-new"
+
+    async def test_broadcast_without_clients_still_stashes(self):
+        web._broadcast(b"frame-headless")
+
+        assert web._last_progress_bytes == b"frame-headless"